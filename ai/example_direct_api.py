@@ -6,11 +6,11 @@ This is a minimal example you can adapt for your own integration.
 """
 
 import os
-import requests
-import json
 
+from gemini_client import call_gemini
 
-def generate_with_gemini(prompt, instructions_text, api_key):
+
+def generate_with_gemini(prompt, instructions_text, api_key, temperature=0.7, use_cache=True):
     """
     Call Gemini API with instructions and user prompt
 
@@ -18,48 +18,17 @@ def generate_with_gemini(prompt, instructions_text, api_key):
         prompt: User's movement request
         instructions_text: The full AGENT_INSTRUCTIONS.md content
         api_key: Gemini API key
+        temperature: Sampling temperature
+        use_cache: Reuse a locally cached reply (low temperatures only)
 
     Returns:
         Generated Python code
     """
-    # Combine instructions with user prompt
-    full_prompt = f"{instructions_text}\n\n---\n\nUSER REQUEST: {prompt}\n\nRemember: Return ONLY executable Python code."
-
-    # API endpoint for Gemini 2.5
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key={api_key}"
-
-    # Request payload
-    payload = {
-        "contents": [{
-            "parts": [{"text": full_prompt}]
-        }],
-        "generationConfig": {
-            "temperature": 0.7,
-            "maxOutputTokens": 8192,
-        }
-    }
-
-    # Make request
-    response = requests.post(
-        url,
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
-
-    if response.status_code != 200:
-        raise Exception(f"API Error: {response.status_code}\n{response.text}")
-
-    # Extract generated code
-    result = response.json()
-    code = result['candidates'][0]['content']['parts'][0]['text']
-
-    # Clean up markdown if present
-    if '```python' in code:
-        start = code.find('```python') + 9
-        end = code.rfind('```')
-        code = code[start:end].strip()
-
-    return code
+    # Instructions are sent once as cached context; only the prompt varies
+    request_text = f"USER REQUEST: {prompt}\n\nRemember: Return ONLY executable Python code."
+
+    return call_gemini(request_text, instructions_text, api_key,
+                       temperature=temperature, use_cache=use_cache)
 
 
 # Example usage
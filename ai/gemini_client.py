@@ -0,0 +1,136 @@
+"""
+Shared Gemini client for movement generation.
+
+Both generator scripts go through call_gemini(), so request building,
+connection reuse, retries, instruction caching, response caching and
+markdown cleanup live in one place.
+"""
+
+import os
+import re
+
+import orjson
+
+from http_session import REQUEST_TIMEOUT, post_with_retry
+from prompt_cache import GEMINI_API_BASE, build_request_contents
+from response_cache import get_cache, is_cacheable, make_key
+
+GEMINI_MODEL = "gemini-2.0-flash-exp"
+
+# Fenced code block in a reply (closing fence optional if the reply was cut off)
+CODE_FENCE = re.compile(r"```(?:python)?[ \t]*\n(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def resolve_api_key(api_key=None):
+    """Return api_key, falling back to the GEMINI_API_KEY env var"""
+    if api_key is None:
+        api_key = os.environ.get('GEMINI_API_KEY')
+        if not api_key:
+            raise ValueError(
+                "GEMINI_API_KEY environment variable not set.\n"
+                "Get your API key from: https://aistudio.google.com/app/apikey\n"
+                "Set it with: export GEMINI_API_KEY='your-key-here'"
+            )
+    return api_key
+
+
+def clean_code(generated_code):
+    """Strip markdown fences if present despite instructions"""
+    match = CODE_FENCE.search(generated_code)
+    if match:
+        generated_code = match.group(1).strip()
+    return generated_code
+
+
+def generate_text(request_text, instructions, api_key, model=GEMINI_MODEL,
+                  temperature=0.7, stream=True, on_chunk=None):
+    """
+    Send one request to Gemini and return the raw reply text
+
+    Args:
+        request_text: The per-call part of the prompt
+        instructions: Static instructions (sent as cached context if possible)
+        api_key: Gemini API key
+        model: Gemini model name
+        temperature: Sampling temperature
+        stream: Read the reply as server-sent events while it is generated
+        on_chunk: Called with each piece of text as it streams in
+
+    Returns:
+        Generated text, unmodified
+    """
+    payload = {
+        **build_request_contents(request_text, instructions, model, api_key),
+        "generationConfig": {
+            "temperature": temperature,
+            "topK": 40,
+            "topP": 0.95,
+            "maxOutputTokens": 8192,
+        }
+    }
+
+    if not stream:
+        url = f"{GEMINI_API_BASE}/models/{model}:generateContent?key={api_key}"
+        response = post_with_retry(url, json=payload, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            raise Exception(f"API Error {response.status_code}: {response.text[:500]}")
+        result = orjson.loads(response.content)
+        return result['candidates'][0]['content']['parts'][0]['text']
+
+    # Streaming endpoint (server-sent events, one JSON chunk per event)
+    url = f"{GEMINI_API_BASE}/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
+
+    with post_with_retry(url, json=payload, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code != 200:
+            raise Exception(f"API Error {response.status_code}: {response.text[:500]}")
+
+        # Accumulate generated text as it arrives
+        parts = []
+        # Raw bytes: the event stream carries no charset, and requests would
+        # decode it as ISO-8859-1; orjson parses the UTF-8 JSON directly
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            chunk = orjson.loads(line[6:])
+            if "error" in chunk:
+                raise Exception(f"API Error: {line[6:506].decode('utf-8', 'replace')}")
+            for candidate in chunk.get("candidates", []):
+                for part in candidate.get("content", {}).get("parts", []):
+                    text = part.get("text", "")
+                    parts.append(text)
+                    if on_chunk is not None:
+                        on_chunk(text)
+
+    return "".join(parts)
+
+
+def call_gemini(request_text, instructions, api_key=None, *, model=GEMINI_MODEL,
+                temperature=0.7, stream=True, use_cache=True, on_chunk=None):
+    """
+    Generate movement code for request_text
+
+    Args:
+        request_text: The per-call part of the prompt
+        instructions: The full AGENT_INSTRUCTIONS.md content
+        api_key: Gemini API key (or uses GEMINI_API_KEY env var)
+        model: Gemini model name
+        temperature: Sampling temperature
+        stream: Stream the reply instead of waiting for the full response
+        use_cache: Reuse a locally cached reply for an identical request
+            (only applies when temperature is low enough to be repeatable)
+        on_chunk: Called with each piece of text as it streams in
+
+    Returns:
+        Generated Python code with any markdown fences removed
+    """
+    api_key = resolve_api_key(api_key)
+
+    def fetch():
+        return clean_code(generate_text(request_text, instructions, api_key, model,
+                                        temperature, stream, on_chunk))
+
+    if use_cache and is_cacheable(temperature):
+        key = make_key(instructions, request_text, model, temperature)
+        return get_cache().get_or_set(key, fetch)
+
+    return fetch()
@@ -0,0 +1,86 @@
+"""
+Shared HTTP session for Gemini API calls.
+
+Reusing one requests.Session keeps the TCP/TLS connection to
+generativelanguage.googleapis.com alive between calls instead of paying a DNS
+lookup and full handshake per request.
+
+post_with_retry() retries rate limits (429) and server errors (5xx) with
+jittered exponential backoff, so a burst of concurrent generations doesn't
+lose work to a single transient failure.
+"""
+
+import random
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds - generations can take a while to read
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Responses worth retrying; any other non-200 is returned to the caller
+RETRY_STATUS = frozenset([429, 500, 502, 503, 504])
+MAX_ATTEMPTS = 6
+BACKOFF_MIN = 1.0
+BACKOFF_MAX = 30.0
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Only retry failed connects here (the request never left);
+            # status and read failures are handled by post_with_retry()
+            retry = Retry(
+                total=2,
+                connect=2,
+                read=0,
+                status=0,
+                backoff_factor=0.5,
+                allowed_methods=frozenset(["GET", "POST"]),
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.headers.update({"Content-Type": "application/json"})
+    return _session
+
+
+def backoff_delay(attempt):
+    """Random delay in [BACKOFF_MIN, 2**attempt s], capped at BACKOFF_MAX"""
+    ceiling = min(BACKOFF_MAX, BACKOFF_MIN * 2 ** attempt)
+    return max(BACKOFF_MIN, random.uniform(0, ceiling))
+
+
+def post_with_retry(url, **kwargs):
+    """
+    POST through the shared session, retrying 429/5xx and timeouts
+
+    Returns the final response (which may still be an error status once
+    attempts run out); other 4xx responses are returned immediately.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            response = get_session().post(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            reason = type(e).__name__
+        else:
+            if response.status_code not in RETRY_STATUS or attempt == MAX_ATTEMPTS:
+                return response
+            reason = f"HTTP {response.status_code}"
+            response.close()
+
+        delay = backoff_delay(attempt)
+        print(f"Attempt {attempt}/{MAX_ATTEMPTS} failed ({reason}), retrying in {delay:.1f}s",
+              file=sys.stderr)
+        time.sleep(delay)
@@ -0,0 +1,140 @@
+"""
+Gemini context caching for the agent instructions.
+
+AGENT_INSTRUCTIONS.md is identical on every request, so it is uploaded once
+as a Gemini `cachedContents` entry and referenced by name afterwards. Only the
+short user request is sent with each call.
+
+Cache names are keyed by a SHA256 of the instructions text and persisted to
+~/.cache/esp32_arm/gemini_cache.json so repeated CLI runs reuse them.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import orjson
+import requests
+
+from http_session import REQUEST_TIMEOUT, get_session
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+# How long Gemini keeps the cached instructions alive
+CACHE_TTL_SECONDS = 3600
+
+CACHE_INDEX_PATH = os.path.expanduser("~/.cache/esp32_arm/gemini_cache.json")
+
+# sha256(instructions) + model -> {"name": cachedContent name or None, "expires": unix time}
+_cache_index = None
+
+# Batch generation calls in from several threads; create each cache only once
+_index_lock = threading.Lock()
+
+
+def _load_index():
+    """Load the on-disk index of cachedContent names"""
+    global _cache_index
+    if _cache_index is None:
+        try:
+            with open(CACHE_INDEX_PATH, 'r') as f:
+                _cache_index = json.load(f)
+        except (OSError, ValueError):
+            _cache_index = {}
+    return _cache_index
+
+
+def _save_index():
+    """Persist the cachedContent index (best effort)"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_INDEX_PATH), exist_ok=True)
+        with open(CACHE_INDEX_PATH, 'w') as f:
+            json.dump(_cache_index, f, indent=2)
+    except OSError:
+        pass
+
+
+def get_cached_instructions(instructions, model, api_key):
+    """
+    Return the name of a Gemini cachedContent holding the instructions.
+
+    The cache is created on first use and reused until it expires. Returns
+    None when caching isn't available. A refusal (e.g. the instructions are
+    below the model's minimum cacheable size) is remembered for the TTL so
+    callers don't pay an extra round-trip on every request; network errors,
+    429s and 5xx are not, so the next call tries again.
+    """
+    with _index_lock:
+        return _get_or_create_cache(instructions, model, api_key)
+
+
+def _get_or_create_cache(instructions, model, api_key):
+    """Look up or create the cachedContent (caller holds _index_lock)"""
+    digest = hashlib.sha256(instructions.encode('utf-8')).hexdigest()
+    key = f"{model}:{digest}"
+
+    index = _load_index()
+    entry = index.get(key)
+    if entry and entry["expires"] > time.time():
+        return entry["name"]
+
+    payload = {
+        "model": f"models/{model}",
+        "contents": [{
+            "role": "user",
+            "parts": [{"text": instructions}]
+        }],
+        "ttl": f"{CACHE_TTL_SECONDS}s",
+    }
+
+    try:
+        response = get_session().post(
+            f"{GEMINI_API_BASE}/cachedContents?key={api_key}",
+            json=payload,
+            timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 200:
+            name = orjson.loads(response.content)["name"]
+        elif response.status_code == 400:
+            # Refused, e.g. below the minimum cacheable size; remember it
+            name = None
+        else:
+            # Rate limit or server error - try again on the next call
+            return None
+    except (requests.RequestException, ValueError, KeyError):
+        return None
+
+    # Expire our entry slightly before Gemini does
+    index[key] = {"name": name, "expires": time.time() + CACHE_TTL_SECONDS - 60}
+    _save_index()
+
+    return name
+
+
+def build_request_contents(prompt_text, instructions, model, api_key):
+    """
+    Build the `contents`/`cachedContent` part of a generateContent payload.
+
+    Static instructions go first (or into the cache), the dynamic user
+    request last, so the prefix never changes between calls.
+    """
+    cache_name = get_cached_instructions(instructions, model, api_key)
+
+    if cache_name:
+        return {
+            "cachedContent": cache_name,
+            "contents": [{
+                "role": "user",
+                "parts": [{"text": prompt_text}]
+            }],
+        }
+
+    # Caching unavailable - fall back to sending the instructions inline
+    return {
+        "contents": [{
+            "role": "user",
+            "parts": [{"text": f"{instructions}\n\n---\n\n{prompt_text}"}]
+        }],
+    }
@@ -0,0 +1,92 @@
+"""
+Local response cache for generated movement code.
+
+Re-running the same prompt while iterating returns the stored reply instead
+of paying another multi-second (and billed) Gemini round-trip. Entries live in
+a small SQLite database keyed by a SHA256 of everything that shapes the
+output: instructions, prompt, model and temperature.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DB_PATH = os.path.expanduser("~/.cache/esp32_arm/responses.sqlite")
+
+# Entries older than this are ignored and overwritten
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+
+# Sampling above this temperature is meant to vary - don't pin one answer
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+
+def make_key(instructions, prompt, model, temperature):
+    """Hash the inputs that determine a generation into a cache key"""
+    raw = "\x00".join([instructions, prompt.strip(), model, str(temperature)])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def is_cacheable(temperature):
+    """Only near-deterministic generations are worth caching"""
+    return temperature <= MAX_CACHEABLE_TEMPERATURE
+
+
+class ResponseCache:
+    """SQLite-backed key -> generated code store with a TTL"""
+
+    def __init__(self, path=CACHE_DB_PATH, ttl=DEFAULT_TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Shared by batch-generation worker threads, so serialize access
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, code TEXT, created REAL)"
+        )
+        self.db.commit()
+
+    def get(self, key):
+        """Return cached code for key, or None if missing/expired"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT code, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return row[0]
+
+    def set(self, key, code):
+        """Store generated code under key"""
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, code, created) VALUES (?, ?, ?)",
+                (key, code, time.time())
+            )
+            self.db.commit()
+
+    def get_or_set(self, key, fetch):
+        """Return the cached value, or call fetch() and cache its result"""
+        code = self.get(key)
+        if code is not None:
+            print("Using cached response (pass --no-cache or use_cache=False to regenerate)")
+            return code
+        code = fetch()
+        self.set(key, code)
+        return code
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Shared cache instance, opened on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+    return _cache
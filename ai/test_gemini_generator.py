@@ -4,6 +4,13 @@ Test script for using Gemini 2.5 API to generate robot arm movement patterns.
 
 Usage:
     python test_gemini_generator.py "Create a wave motion that moves all servos"
+    python test_gemini_generator.py --temperature=0.2 "Create a wave motion"
+    python test_gemini_generator.py --no-cache "Create a wave motion"
+    python test_gemini_generator.py --batch=prompts.txt
+
+Low-temperature (<= 0.3) generations are cached locally; --no-cache forces
+a fresh request. --batch reads one prompt per line and generates them all
+in a single request.
 
 Set your API key:
     export GEMINI_API_KEY="your-api-key-here"
@@ -11,97 +18,177 @@ Set your API key:
 
 import os
 import sys
-import json
-import requests
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from gemini_client import (GEMINI_MODEL, call_gemini, clean_code, generate_text,
+                           resolve_api_key)
+from response_cache import get_cache, is_cacheable, make_key
+
+# Separator between programs in a combined multi-prompt reply
+FILE_DELIMITER = re.compile(r"^===FILE (\d+)===[ \t]*$", re.MULTILINE)
+
+# Everything validate_code() looks for, matched in a single pass
+VALIDATION_CHECKS = re.compile(
+    r'(?P<shebang>\A#!/usr/bin/env python3)'
+    r'|(?P<docstring>""")'
+    r'|(?P<utils>from utils import)'
+    r'|(?P<header>SERVO_HEADER)'
+    r'|(?P<home>home\(\))'
+    r'|(?P<main>if __name__ == "__main__")'
+)
+
+# Concurrent requests for batch generation (Gemini free tier is ~5 RPM-friendly)
+MAX_CONCURRENT_REQUESTS = 5
+
+
+@functools.lru_cache(maxsize=4)
+def _read_text(path, mtime_ns):
+    """Read a text file; cached per (path, mtime) so edits are picked up"""
+    return Path(path).read_text(encoding='utf-8')
+
 
 def load_instructions():
     """Load the AI agent instructions"""
     instructions_path = Path(__file__).parent / "AGENT_INSTRUCTIONS.md"
-    with open(instructions_path, 'r') as f:
-        return f.read()
+    return _read_text(str(instructions_path), instructions_path.stat().st_mtime_ns)
+
+
+def build_request_text(prompt):
+    """The per-call part of the prompt (instructions are sent separately)"""
+    return f"""USER REQUEST: {prompt}
+
+Remember: Return ONLY the executable Python code. No explanations, no markdown blocks, just the raw Python code.
+"""
 
 
-def generate_movement_pattern(prompt, api_key=None):
+def generate_movement_pattern(prompt, api_key=None, temperature=0.7, use_cache=True, on_chunk=None):
     """
     Use Gemini 2.5 API to generate a movement pattern
 
     Args:
         prompt: Description of the movement pattern to generate
         api_key: Gemini API key (or uses GEMINI_API_KEY env var)
+        temperature: Sampling temperature for the generation
+        use_cache: Reuse a locally cached reply for an identical request
+            (only applies when temperature is low enough to be repeatable)
+        on_chunk: Called with each piece of text as it streams in
 
     Returns:
         Generated Python code as string
     """
-    if api_key is None:
-        api_key = os.environ.get('GEMINI_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "GEMINI_API_KEY environment variable not set.\n"
-                "Get your API key from: https://aistudio.google.com/app/apikey\n"
-                "Set it with: export GEMINI_API_KEY='your-key-here'"
-            )
-
-    # Load instructions
+    print(f"Requesting movement pattern from Gemini 2.5...")
+    print(f"Prompt: {prompt}")
+    print("-" * 60)
+
+    return call_gemini(
+        build_request_text(prompt), load_instructions(), api_key,
+        temperature=temperature, use_cache=use_cache, on_chunk=on_chunk
+    )
+
+
+def generate_combined(prompts, api_key=None, temperature=0.7, use_cache=True):
+    """
+    Generate several movement patterns in a single Gemini request
+
+    The instructions are sent once for the whole batch instead of once per
+    prompt; the model separates its programs with ===FILE n=== lines. Any
+    prompt missing from the reply (e.g. output cut off at the token limit)
+    is retried on its own.
+
+    Args:
+        prompts: List of movement descriptions
+        api_key: Gemini API key (or uses GEMINI_API_KEY env var)
+        temperature: Sampling temperature for the generation
+        use_cache: Reuse/store locally cached replies per prompt
+
+    Returns:
+        List of generated code strings, in the same order as prompts
+    """
+    api_key = resolve_api_key(api_key)
     instructions = load_instructions()
 
-    # Construct the full prompt
-    full_prompt = f"""{instructions}
+    # Same keys as generate_movement_pattern(), so single and batch runs share entries
+    cache = get_cache() if use_cache and is_cacheable(temperature) else None
+    keys = [make_key(instructions, build_request_text(p), GEMINI_MODEL, temperature) for p in prompts]
+    codes = [cache.get(k) if cache else None for k in keys]
+    missing = [i for i, code in enumerate(codes) if code is None]
+    if not missing:
+        return codes
 
----
+    numbered = "\n\n".join(f"USER REQUEST {n}: {prompts[i]}" for n, i in enumerate(missing, 1))
+    request_text = f"""{numbered}
 
-USER REQUEST: {prompt}
+Write one complete program for each USER REQUEST above. Start each program with a line containing only ===FILE n=== where n is the request number.
 
 Remember: Return ONLY the executable Python code. No explanations, no markdown blocks, just the raw Python code.
 """
 
-    # Gemini API endpoint
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent?key={api_key}"
-
-    # Request payload
-    payload = {
-        "contents": [{
-            "parts": [{
-                "text": full_prompt
-            }]
-        }],
-        "generationConfig": {
-            "temperature": 0.7,
-            "topK": 40,
-            "topP": 0.95,
-            "maxOutputTokens": 8192,
-        }
-    }
-
-    # Make request
-    print(f"Requesting movement pattern from Gemini 2.5...")
-    print(f"Prompt: {prompt}")
+    print(f"Requesting {len(missing)} movement patterns from Gemini 2.5 in one request...")
     print("-" * 60)
 
-    response = requests.post(url, json=payload, headers={"Content-Type": "application/json"})
+    reply = generate_text(request_text, instructions, api_key, temperature=temperature)
 
-    if response.status_code != 200:
-        error_data = response.json()
-        raise Exception(f"API Error {response.status_code}: {json.dumps(error_data, indent=2)}")
+    # ['', '1', code, '2', code, ...]
+    sections = FILE_DELIMITER.split(reply)
+    for number, body in zip(sections[1::2], sections[2::2]):
+        n = int(number)
+        if 1 <= n <= len(missing) and body.strip():
+            i = missing[n - 1]
+            codes[i] = clean_code(body.strip())
+            if cache:
+                cache.set(keys[i], codes[i])
 
-    # Extract generated text
-    result = response.json()
-    generated_code = result['candidates'][0]['content']['parts'][0]['text']
+    leftover = [i for i in missing if codes[i] is None]
+    if leftover:
+        print(f"{len(leftover)} program(s) missing from the combined reply, requesting separately")
+        retried = generate_many([prompts[i] for i in leftover], api_key,
+                                temperature=temperature, use_cache=use_cache)
+        for i, code in zip(leftover, retried):
+            codes[i] = code
 
-    # Clean up code (remove markdown if present despite instructions)
-    if '```python' in generated_code:
-        # Extract code from markdown block
-        start = generated_code.find('```python') + 9
-        end = generated_code.rfind('```')
-        generated_code = generated_code[start:end].strip()
-    elif '```' in generated_code:
-        # Extract from generic code block
-        start = generated_code.find('```') + 3
-        end = generated_code.rfind('```')
-        generated_code = generated_code[start:end].strip()
+    return codes
 
-    return generated_code
+
+def generate_many(prompts, api_key=None, max_workers=MAX_CONCURRENT_REQUESTS, **kwargs):
+    """
+    Generate several movement patterns concurrently
+
+    The requests are network-bound, so running them in a small thread pool
+    makes k prompts cost about one round-trip instead of k.
+
+    Args:
+        prompts: List of movement descriptions
+        api_key: Gemini API key (or uses GEMINI_API_KEY env var)
+        max_workers: Upper bound on requests in flight
+        **kwargs: Passed through to generate_movement_pattern
+
+    Returns:
+        List of generated code strings, in the same order as prompts
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(generate_movement_pattern, p, api_key, **kwargs) for p in prompts]
+        return [f.result() for f in futures]
+
+
+def next_demo_file():
+    """Find the next available demos/XX_generated.py path"""
+    demos_dir = Path(__file__).parent.parent / "demos"
+
+    # Only the numeric filename prefix matters - no need to stat every file
+    highest = 5
+    with os.scandir(demos_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.endswith(".py") and name[:1].isdigit()):
+                continue
+            prefix = name.split("_", 1)[0]
+            if prefix.isdigit():
+                highest = max(highest, int(prefix))
+
+    return demos_dir / f"{highest + 1:02d}_generated.py"
 
 
 def save_demo(code, output_file):
@@ -117,13 +204,19 @@ def save_demo(code, output_file):
 
 def validate_code(code):
     """Basic validation of generated code"""
+    hits = set()
+    for match in VALIDATION_CHECKS.finditer(code):
+        # The docstring has to open near the top of the file
+        if match.lastgroup != "docstring" or match.start() < 200:
+            hits.add(match.lastgroup)
+
     checks = {
-        "Has shebang": code.startswith("#!/usr/bin/env python3"),
-        "Has docstring": '"""' in code[:200],
-        "Imports from utils": "from utils import" in code,
-        "Has SERVO_HEADER": "SERVO_HEADER" in code,
-        "Calls home()": "home()" in code,
-        "Has main block": 'if __name__ == "__main__"' in code,
+        "Has shebang": "shebang" in hits,
+        "Has docstring": "docstring" in hits,
+        "Imports from utils": "utils" in hits,
+        "Has SERVO_HEADER": "header" in hits,
+        "Calls home()": "home" in hits,
+        "Has main block": "main" in hits,
     }
 
     print("\nValidation Results:")
@@ -139,7 +232,21 @@ def validate_code(code):
 
 
 def main():
-    if len(sys.argv) < 2:
+    use_cache = True
+    temperature = 0.7
+    batch_file = None
+    args = []
+    for arg in sys.argv[1:]:
+        if arg == "--no-cache":
+            use_cache = False
+        elif arg.startswith("--temperature="):
+            temperature = float(arg.split("=", 1)[1])
+        elif arg.startswith("--batch="):
+            batch_file = arg.split("=", 1)[1]
+        else:
+            args.append(arg)
+
+    if not args and batch_file is None:
         print(__doc__)
         print("\nExample prompts:")
         print('  "Create a figure-8 motion pattern"')
@@ -148,36 +255,37 @@ def main():
         print('  "Generate a spiral motion using shoulder and elbow"')
         sys.exit(1)
 
-    prompt = " ".join(sys.argv[1:])
-
     try:
-        # Generate code
-        code = generate_movement_pattern(prompt)
-
-        print("\n" + "=" * 60)
-        print("GENERATED CODE:")
-        print("=" * 60)
-        print(code)
-        print("=" * 60)
-
-        # Validate
-        is_valid = validate_code(code)
-
-        # Save to file
-        # Find next available demo number
-        demos_dir = Path(__file__).parent.parent / "demos"
-        existing_demos = list(demos_dir.glob("*.py"))
-        demo_numbers = [int(f.stem.split("_")[0]) for f in existing_demos if f.stem[0].isdigit()]
-        next_num = max(demo_numbers) + 1 if demo_numbers else 6
-
-        output_file = demos_dir / f"{next_num:02d}_generated.py"
-        save_demo(code, output_file)
-
-        if is_valid:
-            print("\n✓ Code validation passed!")
-            print(f"\nTo run: python {output_file}")
+        if batch_file is not None:
+            with open(batch_file, 'r') as f:
+                prompts = [line.strip() for line in f if line.strip()]
+            codes = generate_combined(prompts, temperature=temperature, use_cache=use_cache)
         else:
-            print("\n⚠ Some validation checks failed. Review code before running.")
+            prompt = " ".join(args)
+            codes = [generate_movement_pattern(
+                prompt, temperature=temperature, use_cache=use_cache,
+                on_chunk=lambda text: print(text, end="", flush=True)
+            )]
+
+        for code in codes:
+            print("\n" + "=" * 60)
+            print("GENERATED CODE:")
+            print("=" * 60)
+            print(code)
+            print("=" * 60)
+
+            # Validate
+            is_valid = validate_code(code)
+
+            # Save to next available demo number
+            output_file = next_demo_file()
+            save_demo(code, output_file)
+
+            if is_valid:
+                print("\n✓ Code validation passed!")
+                print(f"\nTo run: python {output_file}")
+            else:
+                print("\n⚠ Some validation checks failed. Review code before running.")
 
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
@@ -3,6 +3,7 @@
 00: EMERGENCY STOP - Return to home position immediately
 """
 
+import functools
 import sys
 import os
 
@@ -14,17 +15,7 @@ sys.path.insert(0, demos_dir)
 from utils import run_on_esp32, SERVO_HEADER
 from servo_utils import get_calibrated_angles
 
-CODE = SERVO_HEADER + get_calibrated_angles() + '''
-# Wrap servo functions to use calibration
-_original_set_servo_direct = set_servo_direct
-
-def set_servo_direct(servo_num, angle):
-    """Set servo directly with calibration applied"""
-    calibrated = calibrated_angle(servo_num, angle)
-    _original_set_servo_direct(servo_num, calibrated)
-    # Correct smooth_pos to track logical angle
-    smooth_pos[servo_num] = float(angle)
-
+STOP_SEQUENCE = '''
 print("\\n=== EMERGENCY STOP - RETURNING HOME ===\\n")
 
 # Slowly return to safe position WITHOUT rotating base
@@ -43,10 +34,10 @@ for step in range(steps):
     t = step / steps
     s = minimum_jerk(t)
 
-    # Use set_servo_direct for immediate response (no smoothing)
+    # Direct calibrated writes for immediate response (no smoothing)
     # Don't move base (servo 0), only move shoulder, elbow, gripper
     for i in range(1, 4):
-        set_servo_direct(i, int(start_positions[i] + (target_positions[i] - start_positions[i]) * s))
+        set_servo_calibrated(i, int(start_positions[i] + (target_positions[i] - start_positions[i]) * s))
 
     time.sleep(delay)
 
@@ -54,8 +45,15 @@ print("\\n=== SAFE - ARM AT REST POSITION ===")
 print("Base position unchanged")
 '''
 
+
+@functools.lru_cache(maxsize=None)
+def build_code():
+    """Assemble the full emergency-stop program (built once per process)"""
+    return SERVO_HEADER + get_calibrated_angles() + STOP_SEQUENCE
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("  🔴 EMERGENCY STOP - RETURNING TO HOME")
     print("=" * 50)
-    run_on_esp32(CODE)
+    run_on_esp32(build_code())
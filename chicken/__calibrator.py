@@ -35,15 +35,11 @@ set_servo_direct({servo_num}, 90)
 time.sleep(1)
 
 print("Moving to 60° (what we think is one direction)...")
-for angle in range(90, 59, -2):
-    set_servo_direct({servo_num}, angle)
-    time.sleep(0.02)
+ramp({servo_num}, 90, 60, -2)
 time.sleep(1)
 
 print("Moving to 120° (what we think is opposite direction)...")
-for angle in range(60, 121, 2):
-    set_servo_direct({servo_num}, angle)
-    time.sleep(0.02)
+ramp({servo_num}, 60, 120, 2)
 time.sleep(1)
 
 print("Returning to 90° (neutral)...")
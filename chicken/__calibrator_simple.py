@@ -26,15 +26,11 @@ set_servo_direct(1, 90)
 time.sleep(1)
 
 print("Moving to 130° (testing direction 1)...")
-for angle in range(90, 131, 2):
-    set_servo_direct(1, angle)
-    time.sleep(0.02)
+ramp(1, 90, 130, 2)
 time.sleep(1.5)
 
 print("Moving to 60° (testing direction 2)...")
-for angle in range(130, 59, -2):
-    set_servo_direct(1, angle)
-    time.sleep(0.02)
+ramp(1, 130, 60, -2)
 time.sleep(1.5)
 
 print("Returning to 90° (neutral)...")
@@ -67,15 +63,11 @@ set_servo_direct(2, 90)
 time.sleep(1)
 
 print("Moving to 120° (testing direction 1)...")
-for angle in range(90, 121, 2):
-    set_servo_direct(2, angle)
-    time.sleep(0.02)
+ramp(2, 90, 120, 2)
 time.sleep(1.5)
 
 print("Moving to 60° (testing direction 2)...")
-for angle in range(120, 59, -2):
-    set_servo_direct(2, angle)
-    time.sleep(0.02)
+ramp(2, 120, 60, -2)
 time.sleep(1.5)
 
 print("Returning to 90° (neutral)...")
@@ -9,23 +9,28 @@ Instead of "min/max", use descriptive labels:
 - Gripper: "Closed" / "Neutral" / "Open"
 """
 
-import json
 import os
 import sys
-import subprocess
+import threading
 
+import orjson
 from flask import Flask, jsonify, render_template, request
+from waitress import serve
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
-from utils import find_port
+from json_provider import ORJSONProvider, write_json_atomic
+from utils import MOVE_FLUSH_INTERVAL, MoveCoalescer, send_servo_angles
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Current servo positions
 current_positions = [90, 90, 90, 90]
+# Requests are served from several threads
+positions_lock = threading.Lock()
 
 # Semantic mapping for each servo
 # Maps semantic labels to min/max/default
@@ -60,7 +65,6 @@ calibration_data = {
 }
 
 servo_config = None
-PORT = None
 
 
 def load_servo_config():
@@ -68,8 +72,8 @@ def load_servo_config():
     global servo_config
     config_path = os.path.join(script_dir, "servo_config.json")
     try:
-        with open(config_path, 'r') as f:
-            servo_config = json.load(f)
+        with open(config_path, 'rb') as f:
+            servo_config = orjson.loads(f.read())
     except:
         # Default: no inversions
         servo_config = {
@@ -82,41 +86,7 @@ def load_servo_config():
         }
 
 
-def send_single_servo_command(servo_num, angle):
-    """Send command to move a single servo"""
-    global PORT
-    if PORT is None:
-        PORT = find_port()
-        if not PORT:
-            return False
-
-    pin_num = servo_num + 4
-
-    code = f"""
-from machine import Pin, PWM
-
-pin = {pin_num}
-pwm = PWM(Pin(pin), freq=50)
-
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-duty = angle_to_duty({angle})
-pwm.duty(duty)
-print("Servo {servo_num} -> {angle}°")
-"""
-
-    try:
-        result = subprocess.run(
-            ["mpremote", "connect", PORT, "exec", code],
-            capture_output=True,
-            timeout=5,
-            text=True
-        )
-        return result.returncode == 0
-    except Exception as e:
-        print(f"Error: {e}")
-        return False
+move_queue = MoveCoalescer(send_servo_angles, MOVE_FLUSH_INTERVAL)
 
 
 @app.route("/")
@@ -132,9 +102,11 @@ def move():
     angle = data.get("angle")
 
     if servo is not None and angle is not None:
-        current_positions[servo] = angle
-        success = send_single_servo_command(servo, angle)
-        return jsonify({"success": success, "positions": current_positions})
+        with positions_lock:
+            current_positions[servo] = angle
+            positions = list(current_positions)
+        move_queue.queue(servo, angle)
+        return jsonify({"success": True, "positions": positions})
 
     return jsonify({"success": False})
 
@@ -161,7 +133,8 @@ def save_semantic():
         limit_type = semantics["mapping"][semantic_label]
 
         # Get physical angle (what the servo is physically at)
-        physical_angle = current_positions[servo]
+        with positions_lock:
+            physical_angle = current_positions[servo]
 
         # Convert to logical angle if servo is inverted
         # main.py expects LOGICAL angles and applies inversions itself
@@ -193,11 +166,10 @@ def save_semantic():
 def save_calibration():
     """Save calibration to file"""
     output_file = os.path.join(script_dir, "calibration_limits.json")
-    with open(output_file, "w") as f:
-        json.dump(calibration_data, f, indent=2)
+    write_json_atomic(output_file, calibration_data)
 
     print(f"\n✓ Calibration saved to {output_file}")
-    print(json.dumps(calibration_data, indent=2))
+    print(orjson.dumps(calibration_data, option=orjson.OPT_INDENT_2).decode())
 
     return jsonify({"success": True, "file": output_file})
 
@@ -205,8 +177,10 @@ def save_calibration():
 @app.route("/get_data")
 def get_data():
     """Get current positions, calibration, and semantics"""
+    with positions_lock:
+        positions = list(current_positions)
     return jsonify({
-        "positions": current_positions,
+        "positions": positions,
         "calibration": calibration_data,
         "semantics": SERVO_SEMANTICS
     })
@@ -234,4 +208,5 @@ if __name__ == "__main__":
         print(f"⚠️  Note: {', '.join(inverted_servos)} servo(s) marked as inverted")
         print("   Calibrator will automatically handle this!\n")
 
-    app.run(host="0.0.0.0", port=3001, debug=False)
+    # Multi-threaded WSGI server so /get_data polls never wait behind a /move
+    serve(app, host="0.0.0.0", port=3001, threads=8)
@@ -4,24 +4,28 @@ Web-based robot arm calibrator
 Launch this, open browser to http://localhost:3001
 """
 
-import json
 import os
 import sys
+import threading
 
 from flask import Flask, jsonify, render_template, request
+from waitress import serve
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
-import subprocess
-
-from utils import find_port
+from json_provider import ORJSONProvider, write_json_atomic
+from utils import MOVE_FLUSH_INTERVAL, MoveCoalescer, send_servo_angles
 
 app = Flask(__name__)
+# jsonify() / request.json via orjson - /move is hit on every slider tick
+app.json = ORJSONProvider(app)
 
 # Current servo positions
 current_positions = [90, 90, 90, 90]
+# Requests are served from several threads
+positions_lock = threading.Lock()
 calibration_data = {
     "base": {"min": 0, "max": 180, "default": 90},
     "shoulder": {"min": 0, "max": 180, "default": 90},
@@ -29,89 +33,14 @@ calibration_data = {
     "gripper": {"min": 0, "max": 180, "default": 90},
 }
 
-PORT = None
-
-
-def send_single_servo_command(servo_num, angle):
-    """Send command to move a single servo ONLY (completely isolated)"""
-    global PORT
-    if PORT is None:
-        PORT = find_port()
-        if not PORT:
-            print(f"No port found for servo {servo_num}")
-            return False
-
-    # Calculate the actual GPIO pin
-    pin_num = servo_num + 4
-
-    code = f"""
-from machine import Pin, PWM
 
-# Only initialize THIS servo, don't touch others
-pin = {pin_num}
-pwm = PWM(Pin(pin), freq=50)
+def send_servo_moves(moves):
+    """Move only the given servos ({servo_num: angle}) in one session call"""
+    print("Moving " + ", ".join(f"servo {n} to {a}°" for n, a in sorted(moves.items())))
+    return send_servo_angles(moves)
 
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-# Set only this servo
-duty = angle_to_duty({angle})
-pwm.duty(duty)
-print("Servo {servo_num} (GPIO {pin_num}) -> {angle}°")
-"""
-
-    try:
-        print(f"Moving servo {servo_num} (GPIO {pin_num}) to {angle}°")
-        result = subprocess.run(
-            ["mpremote", "connect", PORT, "exec", code],
-            capture_output=True,
-            timeout=5,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"Error moving servo: {result.stderr}")
-        return result.returncode == 0
-    except Exception as e:
-        print(f"Exception moving servo: {e}")
-        return False
 
-
-def send_servo_command(positions):
-    """Send servo positions to ESP32"""
-    global PORT
-    if PORT is None:
-        PORT = find_port()
-        if not PORT:
-            return False
-
-    code = f"""
-from machine import Pin, PWM
-import time
-
-SERVO_PINS = [4, 5, 6, 7]
-servos = []
-for pin in SERVO_PINS:
-    pwm = PWM(Pin(pin), freq=50)
-    servos.append(pwm)
-
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-positions = {positions}
-for i in range(4):
-    duty = angle_to_duty(positions[i])
-    servos[i].duty(duty)
-
-print("Servos set to:", positions)
-"""
-
-    try:
-        result = subprocess.run(
-            ["mpremote", "connect", PORT, "exec", code], capture_output=True, timeout=5
-        )
-        return result.returncode == 0
-    except:
-        return False
+move_queue = MoveCoalescer(send_servo_moves, MOVE_FLUSH_INTERVAL)
 
 
 @app.route("/")
@@ -121,15 +50,18 @@ def index():
 
 @app.route("/move", methods=["POST"])
 def move():
-    """Update servo positions - only moves the single servo that changed"""
+    """Update servo positions - only moves the servos that changed"""
     data = request.json
     servo = data.get("servo")  # 0-3
     angle = data.get("angle")  # 0-180
 
     if servo is not None and angle is not None:
-        current_positions[servo] = angle
-        success = send_single_servo_command(servo, angle)
-        return jsonify({"success": success, "positions": current_positions})
+        with positions_lock:
+            current_positions[servo] = angle
+            positions = list(current_positions)
+        # Sent asynchronously with any other moves in the same window
+        move_queue.queue(servo, angle)
+        return jsonify({"success": True, "positions": positions})
 
     return jsonify({"success": False})
 
@@ -141,9 +73,12 @@ def move_all():
     positions = data.get("positions")
 
     if positions and len(positions) == 4:
-        current_positions[:] = positions
-        success = send_servo_command(current_positions)
-        return jsonify({"success": success, "positions": current_positions})
+        with positions_lock:
+            current_positions[:] = positions
+        # Handed to the flush timer like /move - the request never waits on serial
+        for servo_num, angle in enumerate(positions):
+            move_queue.queue(servo_num, angle)
+        return jsonify({"success": True, "positions": list(positions)})
 
     return jsonify({"success": False})
 
@@ -181,8 +116,7 @@ def save_limit():
 def save_calibration():
     """Save calibration to file"""
     output_file = os.path.join(script_dir, "calibration_limits.json")
-    with open(output_file, "w") as f:
-        json.dump(calibration_data, f, indent=2)
+    write_json_atomic(output_file, calibration_data)
 
     return jsonify({"success": True, "file": output_file})
 
@@ -203,4 +137,4 @@ if __name__ == "__main__":
     print("4. Click 'Save Calibration' when done")
     print("\nPress Ctrl+C to stop\n")
 
-    app.run(host="0.0.0.0", port=3001, debug=False)
+    serve(app, host="0.0.0.0", port=3001, threads=8)
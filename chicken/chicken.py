@@ -9,16 +9,20 @@ Usage:
     python chicken.py workflows/my_task.json
 """
 
-import json
+import functools
+import itertools
 import os
 import sys
-import subprocess
+
+import orjson
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
-from utils import find_port
+from json_provider import read_json_cached
+from micropython_runner import MOTION_RUNTIME
+from utils import find_port, run_in_session
 
 
 def load_workflow(filepath):
@@ -32,16 +36,15 @@ def load_workflow(filepath):
             print(f"Error: Workflow file not found: {filepath}")
             sys.exit(1)
 
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def load_servo_config():
     """Load servo configuration with inversion settings"""
     config_path = os.path.join(script_dir, "servo_config.json")
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return read_json_cached(config_path)
     except:
         # Default: no inversions
         return {
@@ -54,27 +57,35 @@ def load_servo_config():
         }
 
 
-def apply_inversions(logical_positions, servo_config):
-    """Convert logical positions to physical positions based on servo inversions"""
-    servo_names = ["base", "shoulder", "elbow", "gripper"]
-    physical_positions = []
+SERVO_NAMES = ["base", "shoulder", "elbow", "gripper"]
+
 
-    for i, logical_angle in enumerate(logical_positions):
-        servo_name = servo_names[i]
+def inversion_map(servo_config):
+    """
+    Precompute per-servo (offsets, signs) so that
+    physical = offset + sign * logical (inverted servos: 180 - angle)
+    """
+    offsets = []
+    signs = []
+    for servo_name in SERVO_NAMES:
         is_inverted = servo_config['servos'][servo_name].get('inverted', False)
+        offsets.append(180 if is_inverted else 0)
+        signs.append(-1 if is_inverted else 1)
+    return offsets, signs
 
-        if is_inverted:
-            physical_angle = 180 - logical_angle
-        else:
-            physical_angle = logical_angle
 
-        physical_positions.append(physical_angle)
+def apply_inversions(logical_positions, offsets, signs):
+    """Convert logical positions to physical positions using an inversion_map()"""
+    return [offsets[i] + signs[i] * angle for i, angle in enumerate(logical_positions)]
 
-    return physical_positions
 
+def execute_workflow(workflow, verbose=False):
+    """
+    Execute a workflow on the robot
 
-def execute_workflow(workflow):
-    """Execute a workflow on the robot"""
+    Per-step progress is printed by the ESP32 only when verbose is set;
+    otherwise its UART stays quiet while the arm is moving.
+    """
     print("\n" + "=" * 60)
     print(f"  🤖 Executing: {workflow['name']}")
     print("=" * 60)
@@ -99,73 +110,32 @@ def execute_workflow(workflow):
 
     print(f"Connected to: {port}\n")
 
-    # Convert all workflow positions to physical angles
-    converted_steps = []
-    for step in workflow['steps']:
+    # Convert each position to physical angles and render its step code
+    # in one pass (one small exec per step, sent as the robot gets to it)
+    offsets, signs = inversion_map(servo_config)
+    total = len(workflow['steps'])
+    step_codes = []
+    for i, step in enumerate(workflow['steps']):
         logical_pos = step['position']
-        physical_pos = apply_inversions(logical_pos, servo_config)
-        converted_steps.append({
-            'name': step['name'],
-            'position': physical_pos,
-            'duration': step['duration']
-        })
+        physical_pos = apply_inversions(logical_pos, offsets, signs)
         print(f"  {step['name']}: {logical_pos} -> {physical_pos}")
+        progress = f"""
+print("\\n[{i+1}/{total}] {step['name']}")
+print("  Position: {physical_pos}")
+print("  Duration: {step['duration']}s")""" if verbose else ""
+        step_codes.append(f"""{progress}
+move_to_position({physical_pos}, {step['duration']})
+time.sleep(0.3)
+""")
 
     print()
 
     # Generate MicroPython code
-    micropython_code = """
-from machine import Pin, PWM
-import time
-
-SERVO_PINS = [4, 5, 6, 7]
-current_pos = [90, 90, 90, 90]
-
-servos = []
-for pin in SERVO_PINS:
-    pwm = PWM(Pin(pin), freq=50)
-    servos.append(pwm)
-
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-def set_servo(servo_num, angle):
-    duty = angle_to_duty(angle)
-    servos[servo_num].duty(duty)
-    current_pos[servo_num] = angle
-
-def move_to_position(target, duration):
-    start = [current_pos[i] for i in range(4)]
-
-    steps = int(duration / 0.05)
-    if steps == 0:
-        steps = 1
-
-    for step in range(steps + 1):
-        progress = step / steps
-        # Minimum jerk trajectory
-        smooth = 10 * (progress ** 3) - 15 * (progress ** 4) + 6 * (progress ** 5)
-
-        for i in range(4):
-            angle = start[i] + (target[i] - start[i]) * smooth
-            set_servo(i, int(angle))
-
-        time.sleep(0.05)
-
+    setup_code = """
 print("Starting workflow execution...")
 """
 
-    # Add each step (using physical positions)
-    for i, step in enumerate(converted_steps):
-        micropython_code += f"""
-print("\\n[{i+1}/{len(converted_steps)}] {step['name']}")
-print("  Position: {step['position']}")
-print("  Duration: {step['duration']}s")
-move_to_position({step['position']}, {step['duration']})
-time.sleep(0.3)
-"""
-
-    micropython_code += """
+    finish_code = """
 print("\\n✓ Workflow complete!")
 print(f"Final position: {current_pos}")
 """
@@ -174,20 +144,27 @@ print(f"Final position: {current_pos}")
     print("Executing workflow on robot...")
     print("-" * 60)
 
-    result = subprocess.run(
-        ["mpremote", "connect", port, "exec", micropython_code],
-        capture_output=False
-    )
+    success = run_in_session(itertools.chain([setup_code], step_codes, [finish_code]), port,
+                             setup=MOTION_RUNTIME)
 
     print("-" * 60)
 
-    if result.returncode != 0:
+    if not success:
         print("\nError executing workflow!")
         sys.exit(1)
 
     print("\n✓ Workflow execution complete!")
 
 
+@functools.lru_cache(maxsize=256)
+def _workflow_meta(path, mtime_ns):
+    """(name, step count, description) of a workflow file; cached per mtime"""
+    with open(path, 'rb') as f:
+        workflow = orjson.loads(f.read())
+    return (workflow.get('name', 'Untitled'), len(workflow.get('steps', [])),
+            workflow.get('description'))
+
+
 def list_workflows():
     """List all available workflows"""
     workflows_dir = os.path.join(script_dir, "workflows")
@@ -196,27 +173,26 @@ def list_workflows():
         print("No workflows directory found. Create workflows using workflow_designer.py")
         return
 
-    files = [f for f in os.listdir(workflows_dir) if f.endswith(".json")]
+    with os.scandir(workflows_dir) as it:
+        entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
 
-    if not files:
+    if not entries:
         print("No workflows found. Create workflows using workflow_designer.py")
         return
 
     print("\nAvailable workflows:")
     print("-" * 60)
 
-    for filename in sorted(files):
-        filepath = os.path.join(workflows_dir, filename)
+    for entry in entries:
         try:
-            with open(filepath, 'r') as f:
-                workflow = json.load(f)
-                print(f"\n  {filename}")
-                print(f"  Name: {workflow.get('name', 'Untitled')}")
-                print(f"  Steps: {len(workflow.get('steps', []))}")
-                if workflow.get('description'):
-                    print(f"  Description: {workflow['description']}")
+            name, steps, description = _workflow_meta(entry.path, entry.stat().st_mtime_ns)
+            print(f"\n  {entry.name}")
+            print(f"  Name: {name}")
+            print(f"  Steps: {steps}")
+            if description:
+                print(f"  Description: {description}")
         except Exception as e:
-            print(f"\n  {filename} (error loading: {e})")
+            print(f"\n  {entry.name} (error loading: {e})")
 
     print("\n" + "-" * 60)
     print("\nUsage: python chicken.py <filename>")
@@ -227,20 +203,25 @@ def main():
     print("  🐔 Chicken - Workflow Executor")
     print("=" * 60)
 
-    if len(sys.argv) < 2:
-        print("\nUsage: python chicken.py <workflow.json>")
+    args = [a for a in sys.argv[1:] if a not in ("-v", "--verbose")]
+    verbose = len(args) != len(sys.argv) - 1
+
+    if not args:
+        print("\nUsage: python chicken.py [-v] <workflow.json>")
         print("\nExamples:")
         print("  python chicken.py my_workflow.json")
         print("  python chicken.py workflows/pickup.json")
+        print("\nPrint per-step progress from the ESP32:")
+        print("  python chicken.py -v my_workflow.json")
         print("\nList workflows:")
         print("  python chicken.py --list")
         sys.exit(1)
 
-    if sys.argv[1] == "--list" or sys.argv[1] == "-l":
+    if args[0] == "--list" or args[0] == "-l":
         list_workflows()
         sys.exit(0)
 
-    workflow_file = sys.argv[1]
+    workflow_file = args[0]
     workflow = load_workflow(workflow_file)
 
     # Show workflow info
@@ -257,7 +238,7 @@ def main():
         print("Cancelled.")
         sys.exit(0)
 
-    execute_workflow(workflow)
+    execute_workflow(workflow, verbose)
 
 
 if __name__ == "__main__":
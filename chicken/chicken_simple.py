@@ -8,16 +8,19 @@ Usage:
     python chicken_simple.py workflow.json
 """
 
-import json
+import functools
+import itertools
 import os
 import sys
-import subprocess
+
+import orjson
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
-from utils import find_port
+from micropython_runner import MOTION_RUNTIME
+from utils import find_port, run_in_session
 
 
 def load_workflow(filepath):
@@ -31,8 +34,8 @@ def load_workflow(filepath):
             print(f"Error: File not found: {filepath}")
             sys.exit(1)
 
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def execute_workflow(workflow):
@@ -62,42 +65,7 @@ def execute_workflow(workflow):
     print()
 
     # Generate MicroPython code
-    micropython_code = """
-from machine import Pin, PWM
-import time
-
-SERVO_PINS = [4, 5, 6, 7]
-current_pos = [90, 90, 90, 90]
-
-servos = []
-for pin in SERVO_PINS:
-    pwm = PWM(Pin(pin), freq=50)
-    servos.append(pwm)
-
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-def set_servo(servo_num, angle):
-    duty = angle_to_duty(angle)
-    servos[servo_num].duty(duty)
-    current_pos[servo_num] = angle
-
-def move_to_position(target, duration):
-    start = [current_pos[i] for i in range(4)]
-    steps = int(duration / 0.05)
-    if steps == 0:
-        steps = 1
-
-    for step in range(steps + 1):
-        progress = step / steps
-        smooth = 10 * (progress ** 3) - 15 * (progress ** 4) + 6 * (progress ** 5)
-
-        for i in range(4):
-            angle = start[i] + (target[i] - start[i]) * smooth
-            set_servo(i, int(angle))
-
-        time.sleep(0.05)
-
+    setup_code = """
 # HARDCODED: Move to neutral position first
 print("\\nMoving to neutral position...")
 neutral = [90, 90, 90, 90]
@@ -108,15 +76,14 @@ time.sleep(1.0)
 print("\\nStarting workflow...")
 """
 
-    # Add steps - EXACT angles from workflow, NO CONVERSION
-    for i, step in enumerate(workflow['steps']):
-        micropython_code += f"""
+    # Steps - EXACT angles from workflow, NO CONVERSION - one exec each
+    step_codes = (f"""
 print("\\n[{i+1}/{len(workflow['steps'])}] {step['name']}")
 move_to_position({step['position']}, {step['duration']})
 time.sleep(0.3)
-"""
+""" for i, step in enumerate(workflow['steps']))
 
-    micropython_code += """
+    finish_code = """
 print("\\n✓ Complete!")
 """
 
@@ -124,20 +91,27 @@ print("\\n✓ Complete!")
     print("Executing on robot...")
     print("-" * 60)
 
-    result = subprocess.run(
-        ["mpremote", "connect", port, "exec", micropython_code],
-        capture_output=False
-    )
+    success = run_in_session(itertools.chain([setup_code], step_codes, [finish_code]), port,
+                             setup=MOTION_RUNTIME)
 
     print("-" * 60)
 
-    if result.returncode != 0:
+    if not success:
         print("\nError executing workflow!")
         sys.exit(1)
 
     print("\n✓ Workflow complete!")
 
 
+@functools.lru_cache(maxsize=256)
+def _workflow_meta(path, mtime_ns):
+    """(name, step count, description) of a workflow file; cached per mtime"""
+    with open(path, 'rb') as f:
+        workflow = orjson.loads(f.read())
+    return (workflow.get('name', 'Untitled'), len(workflow.get('steps', [])),
+            workflow.get('description'))
+
+
 def list_workflows():
     """List available workflows"""
     workflows_dir = os.path.join(script_dir, "workflows")
@@ -146,25 +120,24 @@ def list_workflows():
         print("No workflows directory found.")
         return
 
-    files = [f for f in os.listdir(workflows_dir) if f.endswith(".json")]
+    with os.scandir(workflows_dir) as it:
+        entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
 
-    if not files:
+    if not entries:
         print("No workflows found.")
         return
 
     print("\nAvailable workflows:")
     print("-" * 60)
 
-    for filename in sorted(files):
-        filepath = os.path.join(workflows_dir, filename)
+    for entry in entries:
         try:
-            with open(filepath, 'r') as f:
-                wf = json.load(f)
-                print(f"\n  {filename}")
-                print(f"  Name: {wf.get('name', 'Untitled')}")
-                print(f"  Steps: {len(wf.get('steps', []))}")
+            name, steps, _ = _workflow_meta(entry.path, entry.stat().st_mtime_ns)
+            print(f"\n  {entry.name}")
+            print(f"  Name: {name}")
+            print(f"  Steps: {steps}")
         except:
-            print(f"\n  {filename} (error)")
+            print(f"\n  {entry.name} (error)")
 
     print("\n" + "-" * 60)
 
@@ -0,0 +1,61 @@
+"""
+orjson-backed JSON for the Flask tools.
+
+Installing ORJSONProvider on an app makes jsonify() and request.json go
+through orjson (a C extension) instead of the pure-Python stdlib encoder.
+write_json_atomic() / write_atomic() save calibration and workflow files
+without leaving torn writes; read_json_cached() loads them back.
+"""
+
+import functools
+import os
+
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class ORJSONProvider(JSONProvider):
+    """Serialize jsonify() responses and request bodies with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def write_atomic(path, payload):
+    """
+    Write bytes to path without ever leaving a torn file.
+
+    The payload goes to a temp file next to path, is fsynced, then renamed
+    over path, so readers see either the old or the new contents.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_json(path, mtime_ns):
+    """Parse a JSON file; cached per (path, mtime) so edits are picked up"""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def read_json_cached(path):
+    """Parsed contents of a JSON file, reused until the file changes"""
+    return _read_json(path, os.stat(path).st_mtime_ns)
+
+
+def dumps_indented(data):
+    """Indented JSON bytes, as written to calibration/workflow files"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+def write_json_atomic(path, data):
+    """Write data as indented JSON atomically (see write_atomic)"""
+    write_atomic(path, dumps_indented(data))
@@ -6,73 +6,188 @@ All positions come from:
 - calibration_limits.json (min/max/default for each servo)
 - correct_sequence.yaml (motion sequences using keywords)
 
-Usage: python main.py [00|01|02|03|04]
+Usage: python main.py [-v] STAGE [STAGE ...]   (stages 00-04)
 """
 
+import functools
+import string
 import sys
 import os
+
 import yaml
-import json
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
-from utils import find_port
-import subprocess
+from json_provider import read_json_cached
+from micropython_runner import CONTROL_HZ, MOTION_RUNTIME
+from utils import angle_to_duty, find_port, run_in_session
+
+
+# libyaml-backed loader when PyYAML was built with it (much faster)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Per-stage device code; MOTION_RUNTIME is sent once per session, so a
+# stage only fills in its data. Parsed once here rather than per stage.
+STAGE_HEADER = string.Template("""
+# Initialize current_pos from calibrated defaults (not hardcoded 90)
+current_pos = $defaults
+
+print("\\n=== STAGE $stage_num: $stage_name ===\\n")
+print("Starting from calibrated defaults:", current_pos)
+""")
+
+STAGE_PLAY = string.Template("""
+play_duties($duties, $final, $cues)
+""")
+
+STAGE_FOOTER = """
+print("\\nFinal position:", current_pos)
+print("=== COMPLETE ===")
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _read_yaml(path, mtime_ns):
+    """Parse a YAML file; cached per (path, mtime) so edits are picked up"""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def _load(filename):
+    """Load a data file next to this script"""
+    path = os.path.join(script_dir, filename)
+    if path.endswith(".yaml"):
+        return _read_yaml(path, os.stat(path).st_mtime_ns)
+    return read_json_cached(path)
 
 
 def load_calibration():
     """Load calibration limits from JSON"""
-    cal_path = os.path.join(script_dir, "calibration_limits.json")
-    with open(cal_path, 'r') as f:
-        return json.load(f)
+    return _load("calibration_limits.json")
 
 
 def load_servo_config():
     """Load servo configuration (includes inversion settings)"""
-    config_path = os.path.join(script_dir, "servo_config.json")
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    try:
+        return _load("servo_config.json")
+    except FileNotFoundError:
+        # No config yet - treat every servo as not inverted
+        return {"servos": {name: {"inverted": False} for name in SERVO_NAMES}}
 
 
 def load_sequence():
     """Load motion sequence from YAML"""
-    yaml_path = os.path.join(script_dir, "correct_sequence.yaml")
-    with open(yaml_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load("correct_sequence.yaml")
 
 
-def resolve_position(position_spec, calibration, servo_config):
+SERVO_NAMES = ['base', 'shoulder', 'elbow', 'gripper']
+
+# Waypoints closer than this (on every joint) to the previous one are dropped
+MIN_MOVE_DEG = 1
+
+
+KEYWORDS = ('min', 'default', 'max')
+
+
+def position_table(calibration, servo_config):
+    """Freeze each servo's (min, default, max) limits and inversion flag, once per stage"""
+    return tuple(
+        (tuple(calibration[servo_name][kw] for kw in KEYWORDS),
+         bool(servo_config['servos'][servo_name].get('inverted', False)))
+        for servo_name in SERVO_NAMES
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_one(spec, limits, inverted):
+    """One servo's keyword or angle -> physical angle; stages reuse the same few"""
+    if isinstance(spec, str):
+        logical_angle = limits[KEYWORDS.index(spec)]
+    else:
+        logical_angle = int(spec)
+    return 180 - logical_angle if inverted else logical_angle
+
+
+def resolve_position(position_spec, table):
     """Convert keywords (min/max/default) to actual angles, applying inversions"""
-    servo_names = ['base', 'shoulder', 'elbow', 'gripper']
     resolved = []
 
     for i, spec in enumerate(position_spec):
-        servo_name = servo_names[i]
-
-        # Get logical angle from spec
-        if isinstance(spec, str):
-            if spec in ['min', 'max', 'default']:
-                logical_angle = calibration[servo_name][spec]
-            else:
-                raise ValueError(f"Invalid keyword '{spec}' for {servo_name}")
-        else:
-            logical_angle = int(spec)
-
-        # Apply inversion if needed
-        is_inverted = servo_config['servos'][servo_name].get('inverted', False)
-        if is_inverted:
-            physical_angle = 180 - logical_angle
-        else:
-            physical_angle = logical_angle
-
-        resolved.append(physical_angle)
+        try:
+            resolved.append(_resolve_one(spec, *table[i]))
+        except ValueError:
+            raise ValueError(f"Invalid keyword '{spec}' for {SERVO_NAMES[i]}") from None
 
     return resolved
 
 
-def run_stage(stage_num):
+def pchip_tangents(positions, durations):
+    """
+    Per-knot velocities (deg/s) for a monotone cubic Hermite trajectory.
+
+    Fritsch-Carlson: interior tangents average the neighbouring secant slopes,
+    are zeroed at local extrema and limited so no joint overshoots a
+    waypoint. The arm starts and ends at rest.
+    """
+    knots = len(positions)
+    tangents = [[0.0] * 4 for _ in range(knots)]
+
+    for i in range(4):
+        slopes = [(positions[k + 1][i] - positions[k][i]) / durations[k]
+                  for k in range(knots - 1)]
+
+        for k in range(1, knots - 1):
+            if slopes[k - 1] * slopes[k] > 0:
+                tangents[k][i] = (slopes[k - 1] + slopes[k]) / 2
+
+        for k, slope in enumerate(slopes):
+            if slope == 0:
+                continue
+            alpha = tangents[k][i] / slope
+            beta = tangents[k + 1][i] / slope
+            norm = alpha * alpha + beta * beta
+            if norm > 9:
+                tau = 3 / norm ** 0.5
+                tangents[k][i] = tau * alpha * slope
+                tangents[k + 1][i] = tau * beta * slope
+
+    return tangents
+
+
+def trajectory_duties(positions, durations, tangents):
+    """
+    Sample the Hermite trajectory at CONTROL_HZ into a flat list of duty
+    cycles (4 per step), so the ESP32 only has to replay it. Also returns
+    the table offset at which each segment starts.
+    """
+    duties = []
+    starts = []
+    for k, h in enumerate(durations):
+        starts.append(len(duties))
+        p0 = positions[k]
+        p1 = positions[k + 1]
+        m0 = [h * m for m in tangents[k]]
+        m1 = [h * m for m in tangents[k + 1]]
+
+        steps = max(1, int(h * CONTROL_HZ))
+        for step in range(1, steps + 1):
+            t = step / steps
+            t2 = t * t
+            t3 = t2 * t
+            h00 = 2 * t3 - 3 * t2 + 1
+            h10 = t3 - 2 * t2 + t
+            h01 = 3 * t2 - 2 * t3
+            h11 = t3 - t2
+            for i in range(4):
+                duties.append(angle_to_duty(
+                    h00 * p0[i] + h10 * m0[i] + h01 * p1[i] + h11 * m1[i]))
+
+    return duties, starts
+
+
+def run_stage(stage_num, verbose=False):
     """Run a stage - load YAML, resolve positions, send to robot"""
     calibration = load_calibration()
     servo_config = load_servo_config()
@@ -83,85 +198,55 @@ def run_stage(stage_num):
     print(f"  STAGE {stage_num}: {stage['name'].upper()}")
     print("=" * 60)
 
-    # Resolve all waypoints
+    # Default positions from calibration (with inversions applied)
+    table = position_table(calibration, servo_config)
+    defaults = resolve_position(['default'] * 4, table)
+
+    # Resolve all waypoints, skipping ones that wouldn't move any joint
     waypoints_resolved = []
+    current = defaults
     for i, wp in enumerate(stage['waypoints']):
-        resolved_pos = resolve_position(wp['position'], calibration, servo_config)
-        waypoints_resolved.append({
-            'position': resolved_pos,
-            'duration': wp['duration'],
-            'description': wp['description']
-        })
+        resolved_pos = resolve_position(wp['position'], table)
 
         print(f"\nWaypoint {i+1}: {wp['description']}")
         print(f"  YAML: {wp['position']}")
         print(f"  Resolved: {resolved_pos}")
-        print(f"  Duration: {wp['duration']}s")
-
-    # Get default positions from calibration (with inversions applied)
-    servo_names = ['base', 'shoulder', 'elbow', 'gripper']
-    defaults = []
-    for servo_name in servo_names:
-        logical_default = calibration[servo_name]['default']
-        is_inverted = servo_config['servos'][servo_name].get('inverted', False)
-        physical_default = (180 - logical_default) if is_inverted else logical_default
-        defaults.append(physical_default)
-
-    # Generate MicroPython code
-    micropython_code = f"""
-from machine import Pin, PWM
-import time
-
-SERVO_PINS = [4, 5, 6, 7]
-# Initialize current_pos from calibrated defaults (not hardcoded 90)
-current_pos = {defaults}
-
-servos = []
-for pin in SERVO_PINS:
-    pwm = PWM(Pin(pin), freq=50)
-    servos.append(pwm)
-
-def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
-
-def set_servo(servo_num, angle):
-    duty = angle_to_duty(angle)
-    servos[servo_num].duty(duty)
-    current_pos[servo_num] = angle
-
-def move_to_position(target, duration):
-    start = [current_pos[i] for i in range(4)]
-
-    steps = int(duration / 0.05)
-    if steps == 0:
-        steps = 1
 
-    for step in range(steps + 1):
-        progress = step / steps
-        smooth = 10 * (progress ** 3) - 15 * (progress ** 4) + 6 * (progress ** 5)
+        if max(abs(t - c) for t, c in zip(resolved_pos, current)) < MIN_MOVE_DEG:
+            print("  Already there - skipped")
+            continue
 
-        for i in range(4):
-            angle = start[i] + (target[i] - start[i]) * smooth
-            set_servo(i, int(angle))
-
-        time.sleep(0.05)
-
-print("\\n=== STAGE {stage_num}: {stage['name'].upper()} ===\\n")
-print("Starting from calibrated defaults:", current_pos)
-"""
-
-    # Add waypoint commands
-    for wp in waypoints_resolved:
-        micropython_code += f"""
-print("  → {wp['description']}")
-move_to_position({wp['position']}, {wp['duration']})
-time.sleep(0.3)
-"""
-
-    micropython_code += """
-print("\\nFinal position:", current_pos)
-print("=== COMPLETE ===")
-"""
+        print(f"  Duration: {wp['duration']}s")
+        waypoints_resolved.append({
+            'position': resolved_pos,
+            'duration': wp['duration'],
+            'description': wp['description']
+        })
+        current = resolved_pos
+
+    # One C1-continuous pass through all waypoints instead of stopping at each
+    positions = [defaults] + [wp['position'] for wp in waypoints_resolved]
+    durations = [wp['duration'] for wp in waypoints_resolved]
+    tangents = pchip_tangents(positions, durations)
+    # Computed here so the ESP32 only writes duty values each step
+    duties, starts = trajectory_duties(positions, durations, tangents)
+    if not duties:
+        # Nothing to move; still drive the servos to hold the defaults
+        duties = [angle_to_duty(a) for a in defaults]
+    # Per-waypoint prints from the ESP32 only with -v
+    cues = None
+    if verbose:
+        cues = {start: wp['description'] for start, wp in zip(starts, waypoints_resolved)}
+
+    # Duties fit in a byte: a bytes literal is ~4x smaller on the wire than
+    # a list and needs no int objects on the device heap
+    micropython_code = "".join([
+        STAGE_HEADER.substitute(defaults=defaults, stage_num=stage_num,
+                                stage_name=stage['name'].upper()),
+        STAGE_PLAY.substitute(duties=repr(bytes(duties)), final=positions[-1],
+                              cues=repr(cues)),
+        STAGE_FOOTER,
+    ])
 
     # Send to robot
     port = find_port()
@@ -171,27 +256,17 @@ print("=== COMPLETE ===")
 
     print(f"\nSending to robot on {port}...")
 
-    # Use full path to mpremote from venv
-    venv_dir = os.path.join(script_dir, "..", ".venv")
-    mpremote_path = os.path.join(venv_dir, "bin", "mpremote")
-
-    if not os.path.exists(mpremote_path):
-        # Fallback to system mpremote
-        mpremote_path = "mpremote"
-
-    result = subprocess.run(
-        [mpremote_path, "connect", port, "exec", micropython_code],
-        capture_output=False
-    )
-
-    if result.returncode != 0:
+    if not run_in_session(micropython_code, port, setup=MOTION_RUNTIME):
         print("\nERROR: Failed to execute!")
         sys.exit(1)
 
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python main.py [00|01|02|03|04]")
+    stages = [a for a in sys.argv[1:] if a not in ("-v", "--verbose")]
+    verbose = len(stages) != len(sys.argv) - 1
+
+    if not stages:
+        print("Usage: python main.py [-v] STAGE [STAGE ...]")
         print()
         print("Stages:")
         print("  00 - Emergency stop (move to defaults)")
@@ -199,17 +274,21 @@ def main():
         print("  02 - Return to baseline")
         print("  03 - Pick up object")
         print("  04 - Drop object")
+        print()
+        print("Several stages run back to back over one serial session,")
+        print("e.g. python main.py 03 04")
         sys.exit(1)
 
-    stage = sys.argv[1]
     valid_stages = ["00", "01", "02", "03", "04"]
 
-    if stage not in valid_stages:
-        print(f"Error: Unknown stage '{stage}'")
-        print(f"Valid stages: {', '.join(valid_stages)}")
-        sys.exit(1)
+    for stage in stages:
+        if stage not in valid_stages:
+            print(f"Error: Unknown stage '{stage}'")
+            print(f"Valid stages: {', '.join(valid_stages)}")
+            sys.exit(1)
 
-    run_stage(stage)
+    for stage in stages:
+        run_stage(stage, verbose)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,18 @@
-# MicroPython code template - this gets sent to ESP32
-# Gets formatted with: calibration data, waypoints, stage info
+# MicroPython code sent to the ESP32.
+#
+# MOTION_RUNTIME holds the servo helpers every executor needs (PWM setup,
+# duty lookup, minimum-jerk moves, trajectory playback); chicken.py,
+# chicken_simple.py and main.py send it once per session ahead of their
+# own step code instead of each carrying a copy.
+# current_pos starts at 90s; callers may reassign it before the first move.
+
+# Servo update rate while moving. Hobby servos only take a new pulse every
+# 20 ms, so rates above 50 Hz are wasted; 20 Hz is smooth with the
+# minimum-jerk profile and keeps the interpreter mostly idle. Host-side
+# trajectories are sampled at the same rate.
+CONTROL_HZ = 20
 
-TEMPLATE = '''
+MOTION_RUNTIME = '''
 from machine import Pin, PWM
 import time
 
@@ -13,34 +24,85 @@ for pin in SERVO_PINS:
     pwm = PWM(Pin(pin), freq=50)
     servos.append(pwm)
 
+# Angle (0-180) -> PWM duty cycle, built once at load in integer math
+_DUTY = tuple((a * 102 + 4770) // 180 for a in range(181))
+
 def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
+    return _DUTY[max(0, min(180, angle))]
 
 def set_servo(servo_num, angle):
     duty = angle_to_duty(angle)
     servos[servo_num].duty(duty)
     current_pos[servo_num] = angle
 
-# Calibration data
-{calibration_code}
+CONTROL_HZ = %d
+STEP_MS = 1000 // CONTROL_HZ
+
+# Minimum jerk profile per step count, shared by moves of equal length
+_smooth_tables = {}
+
+def smooth_table(steps):
+    table = _smooth_tables.get(steps)
+    if table is None:
+        # 10p^3 - 15p^4 + 6p^5 in Horner form: no ** on the soft-float CPU
+        table = []
+        for step in range(steps + 1):
+            p = step / steps
+            table.append(p * p * p * (10 + p * (-15 + 6 * p)))
+        _smooth_tables[steps] = table
+    return table
 
 def move_to_position(target, duration):
     start = [current_pos[i] for i in range(4)]
+    delta = [target[i] - start[i] for i in range(4)]
 
-    steps = int(duration / 0.05)
+    steps = int(duration * CONTROL_HZ)
     if steps == 0:
         steps = 1
 
-    for step in range(steps + 1):
-        progress = step / steps
-        smooth = 10 * (progress ** 3) - 15 * (progress ** 4) + 6 * (progress ** 5)
+    # Pace steps against a fixed STEP_MS schedule so interpreter time
+    # spent updating servos doesn't stretch every step
+    deadline = time.ticks_ms()
+    for smooth in smooth_table(steps):
+        for i in range(4):
+            set_servo(i, int(start[i] + delta[i] * smooth))
+
+        deadline = time.ticks_add(deadline, STEP_MS)
+        wait = time.ticks_diff(deadline, time.ticks_ms())
+        if wait > 0:
+            time.sleep_ms(wait)
 
+def play_duties(tbl, final, cues=None):
+    # Replay a host-computed trajectory: tbl is bytes of [step][servo] duties,
+    # cues maps a table offset to a label printed when it is reached
+    deadline = time.ticks_ms()
+    for step in range(0, len(tbl), 4):
+        if cues and step in cues:
+            print("  →", cues[step])
         for i in range(4):
-            angle = start[i] + (target[i] - start[i]) * smooth
-            calibrated = calibrated_angle(i, int(angle))
-            set_servo(i, calibrated)
+            servos[i].duty(tbl[step + i])
 
-        time.sleep(0.05)
+        deadline = time.ticks_add(deadline, STEP_MS)
+        wait = time.ticks_diff(deadline, time.ticks_ms())
+        if wait > 0:
+            time.sleep_ms(wait)
+
+    for i in range(4):
+        current_pos[i] = final[i]
+''' % CONTROL_HZ
+
+# Stage template built on MOTION_RUNTIME
+# Gets formatted with: calibration data, waypoints, stage info
+
+TEMPLATE = MOTION_RUNTIME.replace("{", "{{").replace("}", "}}") + '''
+# Calibration data
+{calibration_code}
+
+# Waypoints are logical angles - calibrate targets before moving
+_move_physical = move_to_position
+
+def move_to_position(target, duration):
+    _move_physical([calibrated_angle(i, target[i]) for i in range(4)], duration)
 
 # Stage execution
 print("\\n=== STAGE {stage_num}: {stage_name} ===\\n")
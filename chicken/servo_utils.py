@@ -2,9 +2,11 @@
 Servo utilities - loads calibration config and provides angle mapping
 """
 
-import json
+import functools
 import os
 
+from json_provider import read_json_cached
+
 # ============================================
 # GLOBAL SPEED CONTROL
 # ============================================
@@ -37,8 +39,7 @@ def load_config():
             }
         }
 
-    with open(config_path, "r") as f:
-        return json.load(f)
+    return read_json_cached(config_path)
 
 
 def get_calibrated_angles():
@@ -48,17 +49,23 @@ def get_calibrated_angles():
     """
     config = load_config()
 
-    # Build inversion map as Python list
-    inversions = [
+    # Build inversion map
+    inversions = (
         config["servos"]["base"]["inverted"],
         config["servos"]["shoulder"]["inverted"],
         config["servos"]["elbow"]["inverted"],
         config["servos"]["gripper"]["inverted"],
-    ]
+    )
+
+    return _calibration_code(inversions)
 
+
+@functools.lru_cache(maxsize=4)
+def _calibration_code(inversions):
+    """Render the calibration snippet; cached per inversion map"""
     code = f'''
 # Servo calibration data
-SERVO_INVERTED = {inversions}
+SERVO_INVERTED = {list(inversions)}
 
 # Global speed multiplier
 SPEED_MULTIPLIER = {SPEED_MULTIPLIER}
@@ -69,5 +76,12 @@ def calibrated_angle(servo_num, target_angle):
         # Invert: 0->180, 180->0, 90->90
         return 180 - target_angle
     return target_angle
+
+def set_servo_calibrated(servo_num, angle):
+    """Set a servo to a logical angle (int 0-180) with calibration applied"""
+    # Inverted servos index SERVO_HEADER's duty table from the other end
+    servos[servo_num].duty(_DUTY[180 - angle if SERVO_INVERTED[servo_num] else angle])
+    smooth_pos[servo_num] = float(angle)
+    last_move[servo_num] = time.ticks_ms()
 '''
     return code
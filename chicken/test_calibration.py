@@ -6,77 +6,68 @@ Moves each servo through min → default → max positions
 
 import sys
 import os
-import json
-import time
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 demos_dir = os.path.join(script_dir, "..", "demos")
 sys.path.insert(0, demos_dir)
 
+from json_provider import read_json_cached
 from utils import run_on_esp32
 
 
 def load_calibration():
     """Load calibration limits"""
     cal_path = os.path.join(script_dir, "calibration_limits.json")
-    with open(cal_path, 'r') as f:
-        return json.load(f)
+    return read_json_cached(cal_path)
 
 
 def test_servo(servo_num, servo_name, limits):
-    """Test one servo through its range"""
-    min_angle = limits['min']
-    default_angle = limits['default']
-    max_angle = limits['max']
+    """Device code that runs one servo through its range (needs SERVO_TEST_SETUP)"""
+    return (f"test_servo({servo_num}, {servo_name!r}, "
+            f"{limits['min']}, {limits['default']}, {limits['max']})\n")
 
-    print(f"\n{'='*60}")
-    print(f"Testing {servo_name.upper()} (Servo {servo_num})")
-    print(f"  Min: {min_angle}° | Default: {default_angle}° | Max: {max_angle}°")
-    print(f"{'='*60}")
 
-    code = f'''
+# Shared by every servo test. Each servo's PWM is created on its first move
+# (so untested servos aren't driven) and kept for the rest of the run.
+SERVO_TEST_SETUP = '''
 from machine import Pin, PWM
 import time
 
-pin = {servo_num + 4}  # GPIO pins start at 4
-pwm = PWM(Pin(pin), freq=50)
+SERVO_PINS = [4, 5, 6, 7]
+pwms = {}
 
 def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
+    return (angle * 102 + 4770) // 180
 
-def move_to(angle, label):
-    print(f"  → {{label}}: {{angle}}°")
-    pwm.duty(angle_to_duty(angle))
+def move_to(servo_num, angle, label):
+    print(f"  → {label}: {angle}°")
+    duty = angle_to_duty(angle)
+    if servo_num in pwms:
+        pwms[servo_num].duty(duty)
+    else:
+        pwms[servo_num] = PWM(Pin(SERVO_PINS[servo_num]), freq=50, duty=duty)
     time.sleep(2)
 
-print("\\nMoving {servo_name}...")
-move_to({default_angle}, "Default")
-time.sleep(1)
-move_to({min_angle}, "Min")
-time.sleep(1)
-move_to({max_angle}, "Max")
-time.sleep(1)
-move_to({default_angle}, "Back to Default")
-
-print("✓ {servo_name} test complete")
+def test_servo(servo_num, name, min_angle, default_angle, max_angle):
+    print("\\n" + "=" * 60)
+    print(f"Testing {name.upper()} (Servo {servo_num})")
+    print(f"  Min: {min_angle}° | Default: {default_angle}° | Max: {max_angle}°")
+    print("=" * 60)
+    print(f"\\nMoving {name}...")
+    move_to(servo_num, default_angle, "Default")
+    time.sleep(1)
+    move_to(servo_num, min_angle, "Min")
+    time.sleep(1)
+    move_to(servo_num, max_angle, "Max")
+    time.sleep(1)
+    move_to(servo_num, default_angle, "Back to Default")
+    print(f"✓ {name} test complete")
+    time.sleep(1)
 '''
 
-    run_on_esp32(code)
-
-
-def test_all_servos():
-    """Test all servos in sequence"""
-    calibration = load_calibration()
-
-    print("\n" + "="*60)
-    print("  CALIBRATION TEST")
-    print("="*60)
-    print("\nLoaded calibration:")
-    for name, limits in calibration.items():
-        print(f"  {name:10s}: min={limits['min']:3d}° | default={limits['default']:3d}° | max={limits['max']:3d}°")
-
-    input("\nPress Enter to start testing each servo...")
 
+def test_code(calibration):
+    """The whole four-servo test as one ESP32 program"""
     servos = [
         (0, "base", calibration["base"]),
         (1, "shoulder", calibration["shoulder"]),
@@ -84,35 +75,28 @@ def test_all_servos():
         (3, "gripper", calibration["gripper"])
     ]
 
-    for servo_num, servo_name, limits in servos:
+    # One program for all four servos instead of an mpremote run per servo
+    return SERVO_TEST_SETUP + "".join(
         test_servo(servo_num, servo_name, limits)
-        time.sleep(1)
-
-    print("\n" + "="*60)
-    print("  ✓ ALL TESTS COMPLETE")
-    print("="*60)
+        for servo_num, servo_name, limits in servos
+    )
 
 
-def move_to_defaults():
-    """Move all servos to their default positions"""
-    calibration = load_calibration()
-
-    defaults = [
+def home_defaults(calibration):
+    """Default angle of each servo, in pin order"""
+    return [
         calibration["base"]["default"],
         calibration["shoulder"]["default"],
         calibration["elbow"]["default"],
         calibration["gripper"]["default"]
     ]
 
-    print("\n" + "="*60)
-    print("  Moving all servos to DEFAULT positions")
-    print("="*60)
-    print(f"  Base: {defaults[0]}°")
-    print(f"  Shoulder: {defaults[1]}°")
-    print(f"  Elbow: {defaults[2]}°")
-    print(f"  Gripper: {defaults[3]}°")
 
-    code = f'''
+def home_code(calibration):
+    """ESP32 program that moves every servo to its default"""
+    defaults = home_defaults(calibration)
+
+    return f'''
 from machine import Pin, PWM
 import time
 
@@ -120,7 +104,7 @@ SERVO_PINS = [4, 5, 6, 7]
 defaults = {defaults}
 
 def angle_to_duty(angle):
-    return int(round(26 + (angle / 180) * (128 - 26)))
+    return (angle * 102 + 4770) // 180
 
 print("\\nMoving to defaults...")
 for i, pin in enumerate(SERVO_PINS):
@@ -132,7 +116,41 @@ for i, pin in enumerate(SERVO_PINS):
 print("\\n✓ All servos at default positions")
 '''
 
-    run_on_esp32(code)
+
+def test_all_servos():
+    """Test all servos in sequence"""
+    calibration = load_calibration()
+
+    print("\n" + "="*60)
+    print("  CALIBRATION TEST")
+    print("="*60)
+    print("\nLoaded calibration:")
+    for name, limits in calibration.items():
+        print(f"  {name:10s}: min={limits['min']:3d}° | default={limits['default']:3d}° | max={limits['max']:3d}°")
+
+    input("\nPress Enter to start testing each servo...")
+
+    run_on_esp32(test_code(calibration))
+
+    print("\n" + "="*60)
+    print("  ✓ ALL TESTS COMPLETE")
+    print("="*60)
+
+
+def move_to_defaults():
+    """Move all servos to their default positions"""
+    calibration = load_calibration()
+    defaults = home_defaults(calibration)
+
+    print("\n" + "="*60)
+    print("  Moving all servos to DEFAULT positions")
+    print("="*60)
+    print(f"  Base: {defaults[0]}°")
+    print(f"  Shoulder: {defaults[1]}°")
+    print(f"  Elbow: {defaults[2]}°")
+    print(f"  Gripper: {defaults[3]}°")
+
+    run_on_esp32(home_code(calibration))
 
 
 def main():
@@ -0,0 +1,403 @@
+"""
+Shared Flask app for the workflow designers.
+
+workflow_designer.py and workflow_designer_simple.py only differ in their
+page template and in whether servo inversions from servo_config.json are
+applied when moving (the simple designer stores raw angles, as
+chicken_simple.py replays them). Everything else - routes, move batching,
+workflow files - lives here once.
+"""
+
+import functools
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import orjson
+from flask import Flask, jsonify, request, send_from_directory
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+demos_dir = os.path.join(script_dir, "..", "demos")
+sys.path.insert(0, demos_dir)
+
+from json_provider import ORJSONProvider, dumps_indented, read_json_cached, write_atomic
+from utils import MOVE_FLUSH_INTERVAL, MoveCoalescer, send_servo_angles
+
+SERVO_NAMES = ["base", "shoulder", "elbow", "gripper"]
+
+# Default: no inversions
+DEFAULT_SERVO_CONFIG = {
+    "servos": {
+        "base": {"pin": 0, "inverted": False},
+        "shoulder": {"pin": 1, "inverted": False},
+        "elbow": {"pin": 2, "inverted": False},
+        "gripper": {"pin": 3, "inverted": False}
+    }
+}
+
+
+def load_servo_config():
+    """
+    Servo configuration with inversion settings. Checked on every move, so
+    inverting a servo in the calibrator applies without a restart.
+    """
+    config_path = os.path.join(script_dir, "servo_config.json")
+    try:
+        return read_json_cached(config_path)
+    except (OSError, ValueError):
+        return DEFAULT_SERVO_CONFIG
+
+
+def send_inverted_moves(moves):
+    """Move the given servos ({servo_num: logical angle}) in one device call - handles inversions"""
+    servos = load_servo_config()['servos']
+
+    # Apply inversion if needed (convert logical angle to physical angle)
+    physical = {}
+    for servo_num, angle in moves.items():
+        if servos[SERVO_NAMES[servo_num]].get('inverted', False):
+            angle = 180 - angle
+        physical[servo_num] = angle
+
+    return send_servo_angles(physical)
+
+
+# Workflow files are written off the request thread; one worker keeps
+# saves of the same file in order
+save_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _write_workflow(path, payload):
+    """Write a serialized workflow (runs on save_executor)"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, payload)
+        print(f"\n✓ Workflow saved to {path}")
+    except OSError as e:
+        print(f"Error saving workflow: {e}")
+
+
+@functools.lru_cache(maxsize=64)
+def _workflow_summary(path, mtime_ns):
+    """Name, step count and description of a workflow file; cached per mtime"""
+    with open(path, "rb") as f:
+        workflow = orjson.loads(f.read())
+    return {
+        "name": workflow.get("name", "Untitled"),
+        "steps": len(workflow.get("steps", [])),
+        "description": workflow.get("description", "")
+    }
+
+
+def make_app(template, inverted):
+    """
+    Build a designer app serving `template`.
+
+    With inverted=True, positions are logical angles and servos marked
+    inverted in servo_config.json are flipped before moving.
+    """
+    app = Flask(__name__)
+    # jsonify() / request.json via orjson - /get_data is polled and /move is
+    # hit on every slider tick
+    app.json = ORJSONProvider(app)
+
+    # Current servo positions; a tuple, so steps and responses can share it
+    current_positions = (90, 90, 90, 90)
+    # Requests are served from several threads
+    positions_lock = threading.Lock()
+    # Bumped on every workflow change so /get_data?since= can skip resending it
+    workflow_version = 0
+
+    def workflow_changed():
+        nonlocal workflow_version
+        with positions_lock:
+            workflow_version += 1
+
+    # Current workflow being designed
+    current_workflow = {
+        "name": "Untitled Workflow",
+        "description": "",
+        "created": "",
+        "steps": []
+    }
+
+    move_queue = MoveCoalescer(send_inverted_moves if inverted else send_servo_angles,
+                               MOVE_FLUSH_INTERVAL)
+
+    @app.route("/")
+    def index():
+        # The pages are plain HTML, so skip Jinja; sent as a file the browser
+        # revalidates by ETag and gets a 304 on reload
+        return send_from_directory(app.template_folder, template)
+
+    @app.route("/move", methods=["POST"])
+    def move():
+        """Update servo position"""
+        nonlocal current_positions
+        data = request.json
+        servo = data.get("servo")
+        angle = data.get("angle")
+
+        # An out-of-range index would silently grow the positions tuple
+        if (isinstance(servo, int) and 0 <= servo < len(current_positions)
+                and angle is not None):
+            # Whole degrees in range, so saved steps never hold stray floats
+            angle = max(0, min(180, int(round(angle))))
+            with positions_lock:
+                positions = current_positions[:servo] + (angle,) + current_positions[servo + 1:]
+                current_positions = positions
+            # Sent asynchronously with any other moves in the same window
+            move_queue.queue(servo, angle)
+            return jsonify({"success": True, "positions": positions})
+
+        return jsonify({"success": False})
+
+    @app.route("/move_all", methods=["POST"])
+    def move_all():
+        """Move all servos at once"""
+        nonlocal current_positions
+        data = request.json
+        positions = data.get("positions")
+
+        if positions and len(positions) == 4:
+            positions = tuple(max(0, min(180, int(round(a)))) for a in positions)
+            with positions_lock:
+                current_positions = positions
+            for servo_num, angle in enumerate(positions):
+                move_queue.queue(servo_num, angle)
+            return jsonify({"success": True, "positions": positions})
+
+        return jsonify({"success": False})
+
+    @app.route("/add_step", methods=["POST"])
+    def add_step():
+        """Add current position as a step in the workflow"""
+        try:
+            data = request.json
+            step_name = data.get("name", f"Step {len(current_workflow['steps']) + 1}")
+            duration = data.get("duration", 2.0)
+
+            with positions_lock:
+                position = current_positions
+
+            step = {
+                "name": step_name,
+                "position": position,
+                "duration": duration,
+                "description": data.get("description", "")
+            }
+
+            current_workflow["steps"].append(step)
+            workflow_changed()
+
+            print(f"Added step: {step_name}")
+            print(f"  Position: {list(position)}")
+            print(f"  Duration: {duration}s")
+
+            return jsonify({
+                "success": True,
+                "workflow": current_workflow,
+                "step_index": len(current_workflow["steps"]) - 1
+            })
+
+        except Exception as e:
+            print(f"Error adding step: {e}")
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/remove_step", methods=["POST"])
+    def remove_step():
+        """Remove a step from the workflow"""
+        try:
+            data = request.json
+            index = data.get("index")
+
+            if index is not None and 0 <= index < len(current_workflow["steps"]):
+                removed = current_workflow["steps"].pop(index)
+                workflow_changed()
+                print(f"Removed step {index}: {removed['name']}")
+
+                return jsonify({
+                    "success": True,
+                    "workflow": current_workflow
+                })
+
+            return jsonify({"success": False, "error": "Invalid step index"})
+
+        except Exception as e:
+            print(f"Error removing step: {e}")
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/goto_step", methods=["POST"])
+    def goto_step():
+        """Move servos to a specific step's position"""
+        nonlocal current_positions
+        try:
+            data = request.json
+            index = data.get("index")
+
+            if index is not None and 0 <= index < len(current_workflow["steps"]):
+                step = current_workflow["steps"][index]
+                target_positions = step["position"]
+
+                # Move all servos to step position in one command
+                with positions_lock:
+                    current_positions = positions = tuple(target_positions)
+                # Queued like slider moves so an older drag can't land after it
+                for servo_num, angle in enumerate(target_positions):
+                    move_queue.queue(servo_num, angle)
+
+                print(f"Moved to step {index}: {step['name']}")
+
+                return jsonify({
+                    "success": True,
+                    "positions": positions,
+                    "step": step
+                })
+
+            return jsonify({"success": False, "error": "Invalid step index"})
+
+        except Exception as e:
+            print(f"Error going to step: {e}")
+            return jsonify({"success": False, "error": str(e)})
+
+    # The simple designer's page posts to /update_meta
+    @app.route("/update_workflow_meta", methods=["POST"])
+    @app.route("/update_meta", methods=["POST"])
+    def update_workflow_meta():
+        """Update workflow name and description"""
+        try:
+            data = request.json
+            if "name" in data:
+                current_workflow["name"] = data["name"]
+            if "description" in data:
+                current_workflow["description"] = data["description"]
+            workflow_changed()
+
+            return jsonify({"success": True, "workflow": current_workflow})
+
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/save_workflow", methods=["POST"])
+    def save_workflow():
+        """Save workflow to JSON file"""
+        try:
+            current_workflow["created"] = datetime.now().isoformat()
+            workflow_changed()
+
+            # Generate filename from workflow name
+            filename = current_workflow["name"].lower().replace(" ", "_")
+            filename = "".join(c for c in filename if c.isalnum() or c == "_")
+            filename = f"{filename}.json"
+
+            output_file = os.path.join(script_dir, "workflows", filename)
+
+            # Serialized here so later edits can't leak into this save; the
+            # fsync and rename happen in the background
+            payload = dumps_indented(current_workflow)
+            save_executor.submit(_write_workflow, output_file, payload)
+
+            return jsonify({
+                "success": True,
+                "file": output_file,
+                "filename": filename
+            })
+
+        except Exception as e:
+            print(f"Error saving workflow: {e}")
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/load_workflow", methods=["POST"])
+    def load_workflow():
+        """Load a workflow from JSON file"""
+        try:
+            data = request.json
+            filename = data.get("filename")
+
+            if not filename:
+                return jsonify({"success": False, "error": "No filename provided"})
+
+            filepath = os.path.join(script_dir, "workflows", filename)
+
+            if not os.path.exists(filepath):
+                return jsonify({"success": False, "error": "File not found"})
+
+            with open(filepath, "rb") as f:
+                loaded_workflow = orjson.loads(f.read())
+
+            current_workflow.clear()
+            current_workflow.update(loaded_workflow)
+            workflow_changed()
+
+            print(f"Loaded workflow: {current_workflow['name']}")
+            print(f"  Steps: {len(current_workflow['steps'])}")
+
+            return jsonify({
+                "success": True,
+                "workflow": current_workflow
+            })
+
+        except Exception as e:
+            print(f"Error loading workflow: {e}")
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/list_workflows")
+    def list_workflows():
+        """List all saved workflows"""
+        try:
+            workflows_dir = os.path.join(script_dir, "workflows")
+            if not os.path.exists(workflows_dir):
+                return jsonify({"success": True, "workflows": []})
+
+            # Unchanged files cost a stat, not a re-parse
+            workflows = []
+            with os.scandir(workflows_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        summary = _workflow_summary(entry.path, entry.stat().st_mtime_ns)
+                        workflows.append({"filename": entry.name, **summary})
+                    except:
+                        pass
+
+            return jsonify({"success": True, "workflows": workflows})
+
+        except Exception as e:
+            return jsonify({"success": False, "error": str(e)})
+
+    @app.route("/get_data")
+    def get_data():
+        """
+        Get current positions and workflow. With ?since=<version> the
+        workflow is left out when it hasn't changed since that version.
+        """
+        since = request.args.get("since", type=int)
+        with positions_lock:
+            positions = current_positions
+            version = workflow_version
+
+        if since == version:
+            return jsonify({"positions": positions, "version": version, "changed": False})
+
+        return jsonify({
+            "positions": positions,
+            "workflow": current_workflow,
+            "version": version,
+            "changed": True
+        })
+
+    @app.route("/new_workflow", methods=["POST"])
+    def new_workflow():
+        """Start a new workflow"""
+        current_workflow["name"] = "Untitled Workflow"
+        current_workflow["description"] = ""
+        current_workflow["created"] = ""
+        current_workflow["steps"] = []
+        workflow_changed()
+
+        return jsonify({"success": True, "workflow": current_workflow})
+
+    return app
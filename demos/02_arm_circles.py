@@ -4,43 +4,43 @@ Demo 02: Arm Circles
 Shoulder and elbow trace smooth circles together
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+import math
 
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 02: Arm Circles ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 RADIUS = 30
 POINTS = 250
 CIRCLES = 10
-DELAY = 0.004
+STEP_MS = 4
 
-print(f"Drawing {CIRCLES} circles...")
+# One circle, computed here and replayed by the ESP32 for every lap
+_angles = [(i / POINTS) * 2 * math.pi for i in range(POINTS)]
+CIRCLE = {
+    1: [90 + RADIUS * math.sin(a) for a in _angles],
+    2: [90 + RADIUS * math.cos(a) for a in _angles],
+}
+# Smooth return to center from where the last circle ends
+RETURN = {s: blend(CIRCLE[s][-1], 90, 100) for s in CIRCLE}
 
-for circle in range(CIRCLES):
-    print(f"  Circle {circle + 1}/{CIRCLES}")
-    for i in range(POINTS):
-        angle = (i / POINTS) * 2 * math.pi
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 02: Arm Circles ===\\n")
 
-        shoulder = 90 + RADIUS * math.sin(angle)
-        elbow = 90 + RADIUS * math.cos(angle)
+CIRCLES = %d
+CIRCLE = %s
 
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+print(f"Drawing {CIRCLES} circles...")
 
-        time.sleep(DELAY)
+for circle in range(CIRCLES):
+    print(f"  Circle {circle + 1}/{CIRCLES}")
+    play_duties(CIRCLE)
 
 # Smooth return to center
 print("Returning to center...")
-for i in range(100):
-    t = i / 100
-    s = minimum_jerk(t)
-    set_servo(1, smooth_pos[1] + (90 - smooth_pos[1]) * s)
-    set_servo(2, smooth_pos[2] + (90 - smooth_pos[2]) * s)
-    time.sleep(0.004)
+play_duties(%s)
 
 home()
 print("\\n=== Circles complete! ===")
-'''
+''' % (CIRCLES, duty_track(CIRCLE, STEP_MS), duty_track(RETURN, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 02: Arm Circles")
@@ -4,37 +4,34 @@ Demo 03: Base Rotation
 Dramatic acceleration/deceleration sweeps using minimum jerk
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
+
+
+def sweep(start, end, points=300, step_ms=3):
+    """Base sweep with minimum jerk accel/decel, precomputed for the ESP32"""
+    return duty_track({0: blend(start, end, points)}, step_ms)
+
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 03: Base Rotation ===\\n")
 
-def sweep(start, end, points=300, delay=0.003):
-    """Sweep with minimum jerk accel/decel"""
-    for i in range(points):
-        t = i / points
-        s = minimum_jerk(t)
-        pos = start + (end - start) * s
-        set_servo(0, pos)
-        time.sleep(delay)
-
 # Sweep right
 print("Sweeping right (90 -> 160)...")
-sweep(90, 160)
+play_duties(%s)
 time.sleep(0.1)
 
 # Whip left past center
 print("Sweeping left (160 -> 20)...")
-sweep(160, 20)
+play_duties(%s)
 time.sleep(0.1)
 
 # Return to center
 print("Returning to center (20 -> 90)...")
-sweep(20, 90, points=200, delay=0.004)
+play_duties(%s)
 
 home()
 print("\\n=== Base rotation complete! ===")
-'''
+''' % (sweep(90, 160), sweep(160, 20), sweep(20, 90, points=200, step_ms=4))
 
 if __name__ == "__main__":
     print("Demo 03: Base Rotation")
@@ -4,13 +4,10 @@ Demo 08: Smooth Picking Motion
 A smooth picking motion with coordinated servo movements.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Smooth Picking Motion ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 100
-DELAY = 0.01
+STEP_MS = 10
 
 # Define start and end positions for each servo
 start_base = 63
@@ -22,54 +19,42 @@ end_elbow = 140
 start_gripper = 90
 end_gripper = 160  # Close gripper
 
-# --- Reach Forward ---
-print("Reaching forward...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
+REACH = {
+    0: blend(start_base, end_base, STEPS),
+    1: blend(start_shoulder, end_shoulder, STEPS),
+    2: blend(start_elbow, end_elbow, STEPS),
+}
+CLOSE = {3: list(range(start_gripper, end_gripper + 1, 1))}
+LIFT = {
+    1: blend(end_shoulder, 50, 80),
+    2: blend(end_elbow, 90, 80),
+}
+OPEN = {3: list(range(end_gripper, 89, -1))}
 
-    base = start_base + (end_base - start_base) * s
-    shoulder = start_shoulder + (end_shoulder - start_shoulder) * s
-    elbow = start_elbow + (end_elbow - start_elbow) * s
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Smooth Picking Motion ===\\n")
 
-    set_servo(0, base)
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+# --- Reach Forward ---
+print("Reaching forward...")
+play_duties(%s)
 
 time.sleep(0.2)
 
 # --- Close Gripper ---
 print("Closing Gripper...")
-for angle in range(start_gripper, end_gripper + 1, 1):
-    set_servo(3, angle)
-    time.sleep(0.01)
+play_duties(%s)
 
 time.sleep(0.2)
 
 # --- Lift Object ---
 print("Lifting Object...")
-lift_steps = 80
-lift_shoulder_start = end_shoulder
-lift_shoulder_end = 50
-lift_elbow_start = end_elbow
-lift_elbow_end = 90
-for i in range(lift_steps):
-    t = i / lift_steps
-    s = minimum_jerk(t)
-    shoulder = lift_shoulder_start + (lift_shoulder_end - lift_shoulder_start) * s
-    elbow = lift_elbow_start + (lift_elbow_end - lift_elbow_start) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 time.sleep(0.2)
 
 # --- Open Gripper ---
 print("Opening Gripper...")
-for angle in range(end_gripper, 89, -1):
-    set_servo(3, angle)
-    time.sleep(0.01)
+play_duties(%s)
 
 time.sleep(0.2)
 
@@ -77,9 +62,9 @@ time.sleep(0.2)
 print("Returning to Home...")
 home()
 print("\\n=== Smooth Picking Complete! ===")
-'''
+''' % tuple(duty_track(track, STEP_MS) for track in (REACH, CLOSE, LIFT, OPEN))
 
 if __name__ == "__main__":
     print("Demo 08: Smooth Picking Motion")
     print("=" * 30)
-    run_on_esp32(CODE)
\ No newline at end of file
+    run_on_esp32(CODE)
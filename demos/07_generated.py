@@ -4,41 +4,32 @@ Demo 08: Smooth Wave Hello
 Generates a smooth waving motion using the shoulder joint.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
+
+STEPS = 50
+STEP_MS = 10
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Smooth Wave Hello ===\\n")
 
-STEPS = 50
-DELAY = 0.01
+UP = %s
+DOWN = %s
 
 # Wave up and down three times
 for wave in range(3):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(UP)
     print(f"  Wave {wave + 1}/3")
-
-    # Wave up
-    for i in range(STEPS):
-        t = i / STEPS
-        s = minimum_jerk(t)
-        angle = 60 + (80 - 60) * s
-        set_servo(1, angle)
-        time.sleep(DELAY)
-
-    # Wave down
-    for i in range(STEPS):
-        t = i / STEPS
-        s = minimum_jerk(t)
-        angle = 80 + (60 - 80) * s
-        set_servo(1, angle)
-        time.sleep(DELAY)
-
+    wait_duties()
+    play_duties(DOWN)
     time.sleep(0.2)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (duty_track({1: blend(60, 80, STEPS)}, STEP_MS),
+       duty_track({1: blend(80, 60, STEPS)}, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Smooth Wave Hello")
     print("=" * 30)
-    run_on_esp32(CODE)
\ No newline at end of file
+    run_on_esp32(CODE)
@@ -4,10 +4,7 @@ Demo 08: Wave to Crowd
 Simulates a waving motion using the shoulder and elbow joints.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Wave to Crowd ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 # Wave parameters
 WAVE_CYCLES = 3
@@ -16,31 +13,33 @@ SHOULDER_MIN = 50
 SHOULDER_MAX = 70
 ELBOW_MIN = 90
 ELBOW_MAX = 110
-DELAY = 0.015
+STEP_MS = 15
 
-print("Waving to the crowd...")
-for cycle in range(WAVE_CYCLES):
-    print(f"  Wave {cycle + 1}/{WAVE_CYCLES}")
-    for i in range(WAVE_STEPS):
-        t = i / WAVE_STEPS
-        s = minimum_jerk(t)
+# Shoulder up while the elbow swings the opposite way
+WAVE = {
+    1: blend(SHOULDER_MIN, SHOULDER_MAX, WAVE_STEPS),
+    2: blend(ELBOW_MAX, ELBOW_MIN, WAVE_STEPS),
+}
 
-        # Shoulder motion
-        shoulder_angle = SHOULDER_MIN + (SHOULDER_MAX - SHOULDER_MIN) * s
-        set_servo(1, shoulder_angle)
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
-        # Elbow motion (opposite phase for waving)
-        elbow_angle = ELBOW_MAX - (ELBOW_MAX - ELBOW_MIN) * s
-        set_servo(2, elbow_angle)
+WAVE_CYCLES = %d
+WAVE = %s
 
-        time.sleep(DELAY)
+print("Waving to the crowd...")
+for cycle in range(WAVE_CYCLES):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(WAVE)
+    print(f"  Wave {cycle + 1}/{WAVE_CYCLES}")
+    wait_duties()
 
 # Small pause between waves
     time.sleep(0.3)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (WAVE_CYCLES, duty_track(WAVE, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
@@ -4,15 +4,17 @@ Demo 08: Wave to Crowd
 Robot arm waves its gripper while rotating the base
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+BASE_SWEEP = 50
+GRIPPER_SWEEP = 40
+STEP_MS = 15
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
 WAVE_CYCLES = 3
-BASE_SWEEP = 50
-GRIPPER_SWEEP = 40
-DELAY = 0.015
+BASE_RIGHT, GRIPPER_OPEN, BASE_LEFT, GRIPPER_CLOSE, BASE_CENTER = %s
 
 print("Starting wave...")
 
@@ -20,34 +22,30 @@ for cycle in range(WAVE_CYCLES):
     print(f"  Wave cycle {cycle + 1}/{WAVE_CYCLES}")
 
     # Base rotate right
-    for base_angle in range(63, 63 + BASE_SWEEP, 2):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
+    play_duties(BASE_RIGHT)
 
     # Gripper open
-    for gripper_angle in range(90, 90 + GRIPPER_SWEEP, 2):
-        set_servo(3, gripper_angle)
-        time.sleep(DELAY)
+    play_duties(GRIPPER_OPEN)
 
     # Base rotate left
-    for base_angle in range(63 + BASE_SWEEP, 63 - BASE_SWEEP, -2):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
+    play_duties(BASE_LEFT)
 
     # Gripper close
-    for gripper_angle in range(90 + GRIPPER_SWEEP, 90 - GRIPPER_SWEEP, -2):
-        set_servo(3, gripper_angle)
-        time.sleep(DELAY)
+    play_duties(GRIPPER_CLOSE)
 
     # Base rotate center
-    for base_angle in range(63 - BASE_SWEEP, 63, 2):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
+    play_duties(BASE_CENTER)
 
 print("Wave complete!")
 home()
 print("\\n=== Wave to Crowd complete! ===")
-'''
+''' % ("(" + ", ".join(duty_track(move, STEP_MS) for move in (
+    {0: range(63, 63 + BASE_SWEEP, 2)},
+    {3: range(90, 90 + GRIPPER_SWEEP, 2)},
+    {0: range(63 + BASE_SWEEP, 63 - BASE_SWEEP, -2)},
+    {3: range(90 + GRIPPER_SWEEP, 90 - GRIPPER_SWEEP, -2)},
+    {0: range(63 - BASE_SWEEP, 63, 2)},
+)) + ")")
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
@@ -4,19 +4,26 @@ Demo 08: Menacing Gripper
 Moves the gripper in a threatening manner, rotating the base to target different areas.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+STEP_MS = 10
+
+CLOSE = {3: range(80, 150, 3)}
+OPEN = {3: range(150, 80, -3)}
+# Threaten up: shoulder raised while closing, lowered while opening
+CLOSE_UP = {1: [30] * len(CLOSE[3]), **CLOSE}
+OPEN_DOWN = {1: [60] * len(OPEN[3]), **OPEN}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Menacing Gripper ===\\n")
 
+CLOSE = %s
+OPEN = %s
+
 def gripper_threat(base_angle):
-    set_servo(0, base_angle)
-    for angle in range(80, 150, 3):
-        set_servo(3, angle)
-        time.sleep(0.01)
-    for angle in range(150, 80, -3):
-        set_servo(3, angle)
-        time.sleep(0.01)
+    set_servo_direct(0, base_angle)
+    play_duties(CLOSE)
+    play_duties(OPEN)
 
 # Threaten left
 print("Threatening left...")
@@ -35,20 +42,14 @@ time.sleep(0.3)
 
 # Threaten up
 print("Threatening up...")
-set_servo(0, 63)
-for angle in range(80, 150, 3):
-    set_servo(3, angle)
-    set_servo(1, 30)
-    time.sleep(0.01)
-for angle in range(150, 80, -3):
-    set_servo(3, angle)
-    set_servo(1, 60)
-    time.sleep(0.01)
+set_servo_direct(0, 63)
+play_duties(%s)
+play_duties(%s)
 time.sleep(0.3)
 
 home()
 print("\\n=== Menacing complete! ===")
-'''
+''' % tuple(duty_track(track, STEP_MS) for track in (CLOSE, OPEN, CLOSE_UP, OPEN_DOWN))
 
 if __name__ == "__main__":
     print("Demo 08: Menacing Gripper")
@@ -4,38 +4,34 @@ Demo 08: Ground Positioning
 Positions the arm near the ground with open gripper for object placement.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
+
+STEPS = 100
+STEP_MS = 20
+
+# Move shoulder down and extend elbow
+GROUND = {
+    1: blend(60, 90, STEPS),
+    2: blend(100, 40, STEPS),
+}
+OPEN = {3: list(range(90, 180, 1))}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Ground Positioning ===\\n")
 
-STEPS = 100
-DELAY = 0.02
-
 # Positioning near ground
 print("Moving to ground position...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-
-    shoulder = 60 + (90 - 60) * s  # Move shoulder down
-    elbow = 100 + (40 - 100) * s    # Extend elbow
-
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 # Open the gripper
 print("Opening gripper...")
-for angle in range(90, 180, 1):
-    set_servo(3, angle)
-    time.sleep(0.01)
+play_duties(%s)
 
 time.sleep(1)
 
 home()
 print("\\n=== Ground positioning complete! ===")
-'''
+''' % (duty_track(GROUND, STEP_MS), duty_track(OPEN, 10))
 
 if __name__ == "__main__":
     print("Demo 08: Ground Positioning")
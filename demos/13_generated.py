@@ -4,38 +4,32 @@ Demo 08: To The Crowd
 Moves the base servo back and forth in a sweeping motion.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, sweep
 
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: To The Crowd ===\\n")
-
-DELAY = 0.01
+STEP_MS = 10
 SWEEP_RANGE = 45
 CENTER_ANGLE = 63
 SWEEPS = 3
 
-print("Sweeping motion...")
-for sweep in range(SWEEPS):
-    print(f"Sweep {sweep + 1}/{SWEEPS}")
+# Sweep right, sweep left, then return to center
+SWEEP = {0: sweep(CENTER_ANGLE, SWEEP_RANGE)}
 
-    # Sweep right
-    for angle in range(CENTER_ANGLE, CENTER_ANGLE + SWEEP_RANGE, 1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: To The Crowd ===\\n")
 
-    # Sweep left
-    for angle in range(CENTER_ANGLE + SWEEP_RANGE, CENTER_ANGLE - SWEEP_RANGE, -1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
+SWEEPS = %d
+SWEEP = %s
 
-    # Return to center
-    for angle in range(CENTER_ANGLE - SWEEP_RANGE, CENTER_ANGLE, 1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
+print("Sweeping motion...")
+for sweep in range(SWEEPS):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(SWEEP)
+    print(f"Sweep {sweep + 1}/{SWEEPS}")
+    wait_duties()
 
 home()
 print("\\n=== To the crowd complete! ===")
-'''
+''' % (SWEEPS, duty_track(SWEEP, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: To The Crowd")
@@ -4,36 +4,39 @@ Demo 08: Waving Base Rotation
 Rotates the base while waving with the shoulder.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Waving Base Rotation ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, duty_track, sine_table
 
 WAVES = 2
 ROTATIONS = 2
 STEPS = 50
-DELAY = 0.02
+STEP_MS = 20
+
+ROTATE = {0: [63 + 57 * s for s in sine_table(STEPS)]}
+WAVE = {1: [60 + 20 * s for s in sine_table(STEPS)]}
+
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Waving Base Rotation ===\\n")
+
+WAVES = %d
+ROTATIONS = %d
+ROTATE = %s
+WAVE = %s
 
 print("Waving and rotating...")
 
 for rotation in range(ROTATIONS):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(ROTATE)
     print(f"Rotation {rotation + 1}/{ROTATIONS}")
-    for i in range(STEPS):
-        t = i / STEPS
-        angle = 63 + 57 * math.sin(2 * math.pi * t)
-        set_servo(0, angle)
-        time.sleep(DELAY)
+    wait_duties()
     for wave in range(WAVES):
+        start_duties(WAVE)
         print(f"Wave {wave + 1}/{WAVES}")
-        for i in range(STEPS):
-            t = i / STEPS
-            shoulder_angle = 60 + 20 * math.sin(2 * math.pi * t)
-            set_servo(1, shoulder_angle)
-            time.sleep(DELAY)
+        wait_duties()
 
 home()
 print("\\n=== Wave and rotation complete! ===")
-'''
+''' % (WAVES, ROTATIONS, duty_track(ROTATE, STEP_MS), duty_track(WAVE, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Waving Base Rotation")
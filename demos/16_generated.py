@@ -4,30 +4,29 @@ Demo 08: Waving to the Crowd
 The arm waves its "hand" (gripper) back and forth.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+STEP_MS = 10
+
+# Wave right, then back left
+WAVE = {3: list(range(90, 150, 2)) + list(range(150, 90, -2))}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Waving to the Crowd ===\\n")
 
+WAVE = %s
+
 # Wave the gripper back and forth
 for wave in range(3):
     print(f"  Wave {wave + 1}/3")
 
-    # Wave right
-    for angle in range(90, 150, 2):
-        set_servo(3, angle)
-        time.sleep(0.01)
-
-    # Wave left
-    for angle in range(150, 90, -2):
-        set_servo(3, angle)
-        time.sleep(0.01)
+    play_duties(WAVE)
 
     time.sleep(0.2)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % duty_track(WAVE, STEP_MS)
 
 if __name__ == "__main__":
     print("Demo 08: Waving to the Crowd")
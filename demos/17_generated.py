@@ -4,45 +4,45 @@ Demo 08: Wave and Rotate
 Waves the shoulder and rotates the base to greet a crowd
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
+
+WAVE_STEPS = 20
+ROTATE_STEPS = 30
+STEP_MS = 10
+
+
+def linear(t):
+    return t
+
+
+UP = {1: blend(60, 80, WAVE_STEPS, linear)}
+DOWN = {1: blend(80, 60, WAVE_STEPS, linear)}
+ROTATE_OUT = {0: blend(63, 113, ROTATE_STEPS, linear)}
+ROTATE_BACK = {0: blend(113, 63, ROTATE_STEPS, linear)}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave and Rotate ===\\n")
 
-WAVE_STEPS = 20
-ROTATE_STEPS = 30
-DELAY = 0.01
+UP = %s
+DOWN = %s
 
 # Wave the shoulder
 print("Waving...")
 for _ in range(3):
     # Up
-    for i in range(WAVE_STEPS):
-        angle = 60 + (20 * i / WAVE_STEPS)
-        set_servo(1, angle)
-        time.sleep(DELAY)
+    play_duties(UP)
 
     # Down
-    for i in range(WAVE_STEPS):
-        angle = 80 - (20 * i / WAVE_STEPS)
-        set_servo(1, angle)
-        time.sleep(DELAY)
+    play_duties(DOWN)
 
 # Rotate the base
 print("Rotating...")
-for i in range(ROTATE_STEPS):
-    angle = 63 + (50 * i / ROTATE_STEPS)
-    set_servo(0, angle)
-    time.sleep(DELAY)
-
-for i in range(ROTATE_STEPS):
-    angle = 113 - (50 * i / ROTATE_STEPS)
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(%s)
+play_duties(%s)
 
 home()
 print("\\n=== Wave and Rotate complete! ===")
-'''
+''' % tuple(duty_track(track, STEP_MS) for track in (UP, DOWN, ROTATE_OUT, ROTATE_BACK))
 
 if __name__ == "__main__":
     print("Demo 08: Wave and Rotate")
@@ -4,43 +4,42 @@ Demo 08: Wave to Crowd
 Simulates waving to a crowd using base and shoulder movements.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+STEP_MS = 10
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
 WAVES = 3
 DELAY = 0.2
+BASE_LEFT = %s
+SHOULDER_WAVE = %s
+BASE_RIGHT = %s
 
 print("Waving to the crowd...")
+
 for wave in range(WAVES):
     print(f"  Wave {wave + 1}/{WAVES}")
 
     # Move base left
-    for angle in range(63, 20, -1):
-        set_servo(0, angle)
-        time.sleep(0.01)
-
-    # Move shoulder up
-    for angle in range(60, 90, 1):
-        set_servo(1, angle)
-        time.sleep(0.01)
+    play_duties(BASE_LEFT)
 
-    # Move shoulder down
-    for angle in range(90, 60, -1):
-        set_servo(1, angle)
-        time.sleep(0.01)
+    # Move shoulder up and back down
+    play_duties(SHOULDER_WAVE)
 
     # Move base right
-    for angle in range(20, 63, 1):
-        set_servo(0, angle)
-        time.sleep(0.01)
+    play_duties(BASE_RIGHT)
 
     time.sleep(DELAY)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % tuple(duty_track(move, STEP_MS) for move in (
+    {0: range(63, 20, -1)},
+    {1: list(range(60, 90, 1)) + list(range(90, 60, -1))},
+    {0: range(20, 63, 1)},
+))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
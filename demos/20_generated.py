@@ -4,41 +4,37 @@ Demo 08: Wave to the Crowd
 Simulates waving to a crowd by moving the base and shoulder servos.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+import math
+
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+WAVE_COUNT = 3
+STEP_MS = 10
+
+# Wave right, wave left, then back to center
+_base = list(range(63, 90, 1)) + list(range(90, 36, -1)) + list(range(36, 63, 1))
+# Add some shoulder movement along the way
+WAVE = {0: _base, 1: [60 + 5 * math.sin(angle / 10) for angle in _base]}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to the Crowd ===\\n")
 
-WAVE_COUNT = 3
+WAVE_COUNT = %d
 DELAY = 0.1
+WAVE = %s
 
 print("Starting wave...")
 for wave in range(WAVE_COUNT):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(WAVE)
     print(f"Wave {wave + 1}/{WAVE_COUNT}")
-
-    # Wave right
-    for angle in range(63, 90, 1):
-        set_servo(0, angle)
-        set_servo(1, 60 + 5 * math.sin(angle/10)) # Add some shoulder movement
-        time.sleep(0.01)
-
-    # Wave left
-    for angle in range(90, 36, -1):
-        set_servo(0, angle)
-        set_servo(1, 60 + 5 * math.sin(angle/10)) # Add some shoulder movement
-        time.sleep(0.01)
-
-    # Back to center
-    for angle in range(36, 63, 1):
-        set_servo(0, angle)
-        set_servo(1, 60 + 5 * math.sin(angle/10)) # Add some shoulder movement
-        time.sleep(0.01)
+    wait_duties()
 
     time.sleep(DELAY)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (WAVE_COUNT, duty_track(WAVE, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to the Crowd")
@@ -4,33 +4,35 @@ Demo 08: Wave to Crowd
 Waves the arm to simulate greeting a crowd.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+WAVES = 3
+STEP_MS = 10
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
-WAVES = 3
+WAVES = %d
 DELAY = 0.1
+WAVE_OUT = %s
+WAVE_IN = %s
 
 print("Waving to the crowd...")
 for wave in range(WAVES):
     print(f"  Wave {wave + 1}/{WAVES}")
 
     # Wave Out
-    for angle in range(63, 140, 2):
-        set_servo(0, angle)
-        time.sleep(0.01)
+    play_duties(WAVE_OUT)
     time.sleep(DELAY)
 
     # Wave In
-    for angle in range(140, 62, -2):
-        set_servo(0, angle)
-        time.sleep(0.01)
+    play_duties(WAVE_IN)
     time.sleep(DELAY)
 
 home()
 print("\\n=== Waving complete! ===")
-'''
+''' % (WAVES, duty_track({0: range(63, 140, 2)}, STEP_MS),
+       duty_track({0: range(140, 62, -2)}, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
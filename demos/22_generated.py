@@ -4,39 +4,35 @@ Demo 08: Wave to Crowd
 The robot arm waves to an imaginary crowd.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, together
+
+STEP_MS = 10
+
+# Shoulder and elbow are independent joints, so each wave moves both at once
+WAVE_OUT = together({1: range(60, 90, 2)}, {2: range(100, 130, 2)})
+WAVE_IN = together({1: range(90, 60, -2)}, {2: range(130, 100, -2)})
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
+WAVE_OUT = %s
+WAVE_IN = %s
+
 print("Waving...")
 for i in range(3):
     print(f"  Wave {i + 1}/3")
 
-    # Wave 1: Shoulder up
-    for angle in range(60, 90, 2):
-        set_servo(1, angle)
-        time.sleep(0.01)
-    # Elbow out
-    for angle in range(100, 130, 2):
-        set_servo(2, angle)
-        time.sleep(0.01)
-
-    # Wave 2: Shoulder down
-    for angle in range(90, 60, -2):
-        set_servo(1, angle)
-        time.sleep(0.01)
-
-    # Elbow in
-    for angle in range(130, 100, -2):
-        set_servo(2, angle)
-        time.sleep(0.01)
+    # Wave 1: Shoulder up, elbow out
+    play_duties(WAVE_OUT)
+
+    # Wave 2: Shoulder down, elbow in
+    play_duties(WAVE_IN)
 
     time.sleep(0.2)
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (duty_track(WAVE_OUT, STEP_MS), duty_track(WAVE_IN, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
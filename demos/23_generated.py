@@ -4,43 +4,38 @@ Demo 08: Wave to the Crowd
 Waves the arm in a friendly greeting.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, together
+
+STEP_MS = 10
+
+# Base and shoulder are separate joints, so each pair moves at once:
+# base right while the shoulder goes up, then both back together
+OUT = together({0: range(63, 100, 2)}, {1: range(60, 85, 2)})
+BACK = together({0: range(100, 63, -2)}, {1: range(85, 60, -2)})
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to the Crowd ===\\n")
 
+OUT = %s
+BACK = %s
+
 # Wave with base and shoulder
 def wave():
     for i in range(3):
         print(f"  Wave {i + 1}/3")
 
-        # Move base right
-        for angle in range(63, 100, 2):
-            set_servo(0, angle)
-            time.sleep(0.01)
+        # Base right, shoulder up
+        play_duties(OUT)
 
-        # Move shoulder up
-        for angle in range(60, 85, 2):
-            set_servo(1, angle)
-            time.sleep(0.01)
-
-        # Move shoulder down
-        for angle in range(85, 60, -2):
-            set_servo(1, angle)
-            time.sleep(0.01)
-
-        # Move base left
-        for angle in range(100, 63, -2):
-            set_servo(0, angle)
-            time.sleep(0.01)
+        # Shoulder down, base left
+        play_duties(BACK)
 
         time.sleep(0.2)
 
 wave()
-
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (duty_track(OUT, STEP_MS), duty_track(BACK, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to the Crowd")
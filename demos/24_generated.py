@@ -4,44 +4,39 @@ Demo 08: Gentle Bow
 The robot arm performs a slow, gentle bowing motion
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Gentle Bow ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 100
-DELAY = 0.02
+STEP_MS = 20
 
 start_shoulder = 60
 start_elbow = 100
 
+BOW = {
+    1: blend(start_shoulder, 80, STEPS),
+    2: blend(start_elbow, 80, STEPS),
+}
+UPRIGHT = {
+    1: blend(80, start_shoulder, STEPS),
+    2: blend(80, start_elbow, STEPS),
+}
+
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Gentle Bow ===\\n")
+
 # Bow down
 print("Bowing...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    shoulder = start_shoulder + (80 - start_shoulder) * s
-    elbow = start_elbow + (80 - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 time.sleep(0.5)
 
 # Return to upright
 print("Returning...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    shoulder = 80 + (start_shoulder - 80) * s
-    elbow = 80 + (start_elbow - 80) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 home()
 print("\\n=== Bow complete! ===")
-'''
+''' % (duty_track(BOW, STEP_MS), duty_track(UPRIGHT, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Gentle Bow")
@@ -4,62 +4,48 @@ Demo 08: Waving Base
 Rotates the base back and forth to simulate waving.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
+
+WAVE_ANGLE = 30
+STEPS = 30
+STEP_MS = 10
+
+RIGHT = {0: blend(63, 63 + WAVE_ANGLE, STEPS)}
+LEFT = {0: blend(63, 63 - WAVE_ANGLE, STEPS)}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Waving Base ===\\n")
 
-WAVE_ANGLE = 30
-STEPS = 30
-DELAY = 0.01
+RIGHT = %s
+LEFT = %s
 
 # Wave Right
 print("Waving right...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    angle = 63 + WAVE_ANGLE * s
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(RIGHT)
 
 time.sleep(0.2)
 
 # Wave Left
 print("Waving left...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    angle = 63 + -WAVE_ANGLE * s
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(LEFT)
 
 time.sleep(0.2)
 
 # Wave Right
 print("Waving right...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    angle = 63 + WAVE_ANGLE * s
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(RIGHT)
 
 time.sleep(0.2)
 
 # Wave Left
 print("Waving left...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    angle = 63 + -WAVE_ANGLE * s
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(LEFT)
 
 time.sleep(0.2)
 
 home()
 print("\\n=== Waving complete! ===")
-'''
+''' % (duty_track(RIGHT, STEP_MS), duty_track(LEFT, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Waving Base")
@@ -4,13 +4,10 @@ Demo 08: Bow
 Simulates a bowing motion to the crowd.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Bow ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 70
-DELAY = 0.01
+STEP_MS = 10
 
 # Initial position (standing straight)
 start_shoulder = 60
@@ -20,36 +17,30 @@ start_elbow = 100
 target_shoulder = 80  # Move shoulder up
 target_elbow = 50   # Move elbow back
 
-print("Bowing...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
+BOW = {
+    1: blend(start_shoulder, target_shoulder, STEPS),
+    2: blend(start_elbow, target_elbow, STEPS),
+}
+UPRIGHT = {
+    1: blend(target_shoulder, start_shoulder, STEPS),
+    2: blend(target_elbow, start_elbow, STEPS),
+}
 
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Bow ===\\n")
 
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+print("Bowing...")
+play_duties(%s)
 
 time.sleep(0.5)
 
 # Return to upright position
 print("Returning to upright...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-
-    shoulder = target_shoulder + (start_shoulder - target_shoulder) * s
-    elbow = target_elbow + (start_elbow - target_elbow) * s
-
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 home()
 print("\\n=== Bow complete! ===")
-'''
+''' % (duty_track(BOW, STEP_MS), duty_track(UPRIGHT, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Bow")
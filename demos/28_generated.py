@@ -4,41 +4,40 @@ Demo 08: Waving Hello
 Waves the robot arm to greet an audience
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, together
+
+STEP_MS = 10
+
+# Shoulder and elbow move together, so each step writes both at once
+_up = range(45, 75, 1)
+_down = range(74, 44, -1)
+# The gripper opens on the way up and closes on the way down
+WAVE_UP = together({1: _up, 2: [110 - (angle - 45) for angle in _up]},
+                   {3: range(90, 150, 2)})
+WAVE_DOWN = together({1: _down, 2: [110 - (angle - 45) for angle in _down]},
+                     {3: range(150, 90, -2)})
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Waving Hello ===\\n")
 
+WAVE_UP = %s
+WAVE_DOWN = %s
+
 # Wave the arm multiple times
 for i in range(5):
     print(f"  Wave {i+1}/5")
 
-    # Open Gripper
-    for angle in range(90, 150, 2):
-        set_servo(3, angle)
-        time.sleep(0.01)
-
-    # Wave with shoulder and elbow
-    for angle in range(45, 75, 1):
-        set_servo(1, angle)
-        set_servo(2, 110 - (angle - 45))
-        time.sleep(0.01)
-
-    for angle in range(74, 44, -1):
-        set_servo(1, angle)
-        set_servo(2, 110 - (angle - 45))
-        time.sleep(0.01)
+    # Open Gripper while waving up
+    play_duties(WAVE_UP)
 
-    # Close Gripper
-    for angle in range(150, 90, -2):
-        set_servo(3, angle)
-        time.sleep(0.01)
+    # Close Gripper while waving down
+    play_duties(WAVE_DOWN)
 
     time.sleep(0.2)
 
 home()
 print("\\n=== Waving complete! ===")
-'''
+''' % (duty_track(WAVE_UP, STEP_MS), duty_track(WAVE_DOWN, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Waving Hello")
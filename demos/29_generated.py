@@ -4,37 +4,31 @@ Demo 08: Wave to Crowd
 Waves the arm back and forth to simulate waving to a crowd.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, sweep
+
+WAVES = 3
+SWEEP_RANGE = 30
+STEP_MS = 10
+
+# Wave out, wave back, then return to center
+WAVE = {0: sweep(63, SWEEP_RANGE)}
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to Crowd ===\\n")
 
-WAVES = 3
-SWEEP_RANGE = 30
-DELAY = 0.01
+WAVES = %d
+WAVE = %s
 
 print(f"Waving {WAVES} times...")
 for wave in range(WAVES):
+    # Printed while the track plays, so the UART write doesn't delay it
+    start_duties(WAVE)
     print(f"  Wave {wave + 1}/{WAVES}")
-
-    # Wave out
-    for angle in range(63, 63 + SWEEP_RANGE, 1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
-
-    # Wave back
-    for angle in range(63 + SWEEP_RANGE, 63 - SWEEP_RANGE, -1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
-
-    # Return to center
-    for angle in range(63 - SWEEP_RANGE, 63, 1):
-        set_servo(0, angle)
-        time.sleep(DELAY)
+    wait_duties()
 
 home()
 print("\\n=== Wave complete! ===")
-'''
+''' % (WAVES, duty_track(WAVE, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to Crowd")
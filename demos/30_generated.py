@@ -4,13 +4,10 @@ Demo 08: Bow
 Simulates a bowing motion.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Bow ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 50
-DELAY = 0.02
+STEP_MS = 20
 
 # Initial positions
 start_shoulder = 60
@@ -20,35 +17,29 @@ start_elbow = 100
 bow_shoulder = 80
 bow_elbow = 70
 
-print("Bowing...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
+BOW = {
+    1: blend(start_shoulder, bow_shoulder, STEPS),
+    2: blend(start_elbow, bow_elbow, STEPS),
+}
+UPRIGHT = {
+    1: blend(bow_shoulder, start_shoulder, STEPS),
+    2: blend(bow_elbow, start_elbow, STEPS),
+}
 
-    shoulder = start_shoulder + (bow_shoulder - start_shoulder) * s
-    elbow = start_elbow + (bow_elbow - start_elbow) * s
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Bow ===\\n")
 
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+print("Bowing...")
+play_duties(%s)
 
 time.sleep(0.5)
 
 print("Returning to upright position...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-
-    shoulder = bow_shoulder + (start_shoulder - bow_shoulder) * s
-    elbow = bow_elbow + (start_elbow - bow_elbow) * s
-
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 home()
 print("\\n=== Bow complete! ===")
-'''
+''' % (duty_track(BOW, STEP_MS), duty_track(UPRIGHT, STEP_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Bow")
@@ -4,26 +4,23 @@ Demo 08: Open Gripper Sequence
 Opens the gripper twice in succession.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, PWM_FRAME_MS, duty_track, goto
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Open Gripper Sequence ===\\n")
 
 print("Opening Gripper...")
-for angle in range(90, 181, 2):
-    set_servo(3, angle)
-    time.sleep(0.01)
+play_duties(%s)
 
 time.sleep(0.5)
 
 print("Opening Gripper Again...")
-for angle in range(180, 181, 2):
-    set_servo(3, angle)
-    time.sleep(0.01)
+play_duties(%s)
 
 home()
 print("\\n=== Open Gripper Sequence complete! ===")
-'''
+''' % (duty_track(goto(3, 90, 180, 460), PWM_FRAME_MS),
+       duty_track(goto(3, 180, 180, 10), PWM_FRAME_MS))
 
 if __name__ == "__main__":
     print("Demo 08: Open Gripper Sequence")
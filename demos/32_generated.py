@@ -4,29 +4,28 @@ Demo 08: Funny Base Rotation
 Rotates the base servo back and forth with varying speeds.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, sine_table
+
+def wobble(center, amplitude, duration_ms, step_ms):
+    """One full sine wobble of the base, sampled every step_ms"""
+    steps = duration_ms // step_ms
+    angles = [center + amplitude * s for s in sine_table(steps)]
+    return duty_track({0: angles}, step_ms)
+
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Funny Base Rotation ===\\n")
 
-def wobble(center, amplitude, duration, delay):
-    start_time = time.ticks_ms()
-    while time.ticks_diff(time.ticks_ms(), start_time) < duration:
-        t = (time.ticks_ms() - start_time) / duration
-        angle = center + amplitude * math.sin(2 * math.pi * t)
-        set_servo(0, angle)
-        time.sleep(delay)
-
 print("Starting funny base rotation...")
-wobble(63, 40, 2000, 0.01)  # Quick wobble
+play_duties(%s)  # Quick wobble
 time.sleep(0.5)
-wobble(63, 60, 3000, 0.02)  # Slower, wider wobble
+play_duties(%s)  # Slower, wider wobble
 time.sleep(0.5)
-wobble(63, 20, 1000, 0.005) # Very fast, small wobble
+play_duties(%s) # Very fast, small wobble
 
 home()
 print("\\n=== Funny base rotation complete! ===")
-'''
+''' % (wobble(63, 40, 2000, 10), wobble(63, 60, 3000, 20), wobble(63, 20, 1000, 5))
 
 if __name__ == "__main__":
     print("Demo 08: Funny Base Rotation")
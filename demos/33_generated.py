@@ -4,15 +4,27 @@ Demo 08: Wave to the Crowd
 The robot arm waves to the crowd by moving its base and shoulder.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track, together
+
+BASE_SWEEP = 20  # degrees
+SHOULDER_SWEEP = 15 # degrees
+STEP_MS = 15
+
+# Base and shoulder move together: right, left, then back to center
+RIGHT = together({0: range(63, 63 + BASE_SWEEP, 1)},
+                 {1: range(60, 60 + SHOULDER_SWEEP, 1)})
+LEFT = together({0: range(63 + BASE_SWEEP, 63 - BASE_SWEEP, -1)},
+                {1: range(60 + SHOULDER_SWEEP, 60 - SHOULDER_SWEEP, -1)})
+CENTER = together({0: range(63 - BASE_SWEEP, 63, 1)},
+                  {1: range(60 - SHOULDER_SWEEP, 60, 1)})
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Wave to the Crowd ===\\n")
 
 WAVE_CYCLES = 3
-BASE_SWEEP = 20  # degrees
-SHOULDER_SWEEP = 15 # degrees
-DELAY = 0.015
+RIGHT = %s
+LEFT = %s
+CENTER = %s
 
 print("Waving to the crowd...")
 
@@ -20,34 +32,19 @@ for wave in range(WAVE_CYCLES):
     print(f"  Wave {wave + 1}/{WAVE_CYCLES}")
 
     # Wave right
-    for base_angle in range(63, 63 + BASE_SWEEP, 1):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
-    for shoulder_angle in range(60, 60 + SHOULDER_SWEEP, 1):
-        set_servo(1, shoulder_angle)
-        time.sleep(DELAY)
+    play_duties(RIGHT)
 
     # Wave left
-    for base_angle in range(63 + BASE_SWEEP, 63 - BASE_SWEEP, -1):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
-    for shoulder_angle in range(60 + SHOULDER_SWEEP, 60 - SHOULDER_SWEEP, -1):
-        set_servo(1, shoulder_angle)
-        time.sleep(DELAY)
+    play_duties(LEFT)
 
     # Back to center
-    for base_angle in range(63 - BASE_SWEEP, 63, 1):
-        set_servo(0, base_angle)
-        time.sleep(DELAY)
-    for shoulder_angle in range(60 - SHOULDER_SWEEP, 60, 1):
-        set_servo(1, shoulder_angle)
-        time.sleep(DELAY)
+    play_duties(CENTER)
 
     time.sleep(0.2)  # Pause between waves
 
 home()
 print("\\n=== Waving complete! ===")
-'''
+''' % tuple(duty_track(move, STEP_MS) for move in (RIGHT, LEFT, CENTER))
 
 if __name__ == "__main__":
     print("Demo 08: Wave to the Crowd")
@@ -4,34 +4,29 @@ Demo 08: Playful Base Rotation
 Rotates the base left and right in a smooth, playful manner.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
+from utils import run_on_esp32, SERVO_HEADER, duty_track
+
+STEP_MS = 15
 
 CODE = SERVO_HEADER + '''
 print("\\n=== DEMO 08: Playful Base Rotation ===\\n")
 
-DELAY = 0.015
-
 # Rotate right
 print("Rotating right...")
-for angle in range(63, 150, 1):
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(%s)
 
 # Rotate left
 print("Rotating left...")
-for angle in range(150, 15, -1):
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(%s)
 
 # Rotate back to center
 print("Returning to center...")
-for angle in range(15, 63, 1):
-    set_servo(0, angle)
-    time.sleep(DELAY)
+play_duties(%s)
 
 home()
 print("\\n=== Playful rotation complete! ===")
-'''
+''' % tuple(duty_track({0: angles}, STEP_MS)
+            for angles in (range(63, 150, 1), range(150, 15, -1), range(15, 63, 1)))
 
 if __name__ == "__main__":
     print("Demo 08: Playful Base Rotation")
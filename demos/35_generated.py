@@ -4,69 +4,57 @@ Demo 08: Pick Up Object
 Reaches forward, grips, and lifts an imaginary object.
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Pick Up Object ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 100
-DELAY = 0.015
+STEP_MS = 15
 
 # Initial positions
 start_shoulder = 60
 start_elbow = 100
 
 # Reach forward
-print("Reaching forward...")
 target_shoulder = 30
 target_elbow = 140
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
-
-time.sleep(0.5)
+REACH = {
+    1: blend(start_shoulder, target_shoulder, STEPS),
+    2: blend(start_elbow, target_elbow, STEPS),
+}
 
 # Grip
-print("Gripping...")
 start_gripper = 90
 target_gripper = 160
 GRIP_STEPS = 50
-for i in range(GRIP_STEPS):
-    t = i / GRIP_STEPS
-    s = minimum_jerk(t)
-    gripper = start_gripper + (target_gripper - start_gripper) * s
-    set_servo(3, gripper)
-    time.sleep(DELAY)
+GRIP = {3: blend(start_gripper, target_gripper, GRIP_STEPS)}
+
+# Lift slightly
+LIFT_STEPS = 75
+LIFT = {
+    1: blend(target_shoulder, 40, LIFT_STEPS),
+    2: blend(target_elbow, 130, LIFT_STEPS),
+}
+
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Pick Up Object ===\\n")
+
+print("Reaching forward...")
+play_duties(%s)
 
 time.sleep(0.5)
 
-# Lift slightly
-print("Lifting...")
-start_shoulder = target_shoulder
-start_elbow = target_elbow
-target_shoulder = 40
-target_elbow = 130
+print("Gripping...")
+play_duties(%s)
 
-LIFT_STEPS = 75
-for i in range(LIFT_STEPS):
-    t = i / LIFT_STEPS
-    s = minimum_jerk(t)
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+time.sleep(0.5)
+
+print("Lifting...")
+play_duties(%s)
 
 time.sleep(0.5)
 
 home()
 print("\\n=== Pick up complete! ===")
-'''
+''' % tuple(duty_track(track, STEP_MS) for track in (REACH, GRIP, LIFT))
 
 if __name__ == "__main__":
     print("Demo 08: Pick Up Object")
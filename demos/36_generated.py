@@ -4,18 +4,16 @@ Demo 08: Pick Up Object (Smooth)
 Reaches forward, grips, lifts slightly, and releases
 """
 
-from utils import run_on_esp32, SERVO_HEADER
-
-CODE = SERVO_HEADER + '''
-print("\\n=== DEMO 08: Pick Up Object (Smooth) ===\\n")
+from utils import run_on_esp32, SERVO_HEADER, blend, duty_track
 
 STEPS = 50
-DELAY = 0.02
+STEP_MS = 20
 
-# Initial positions (assumed)
-start_shoulder = smooth_pos[1]  # Current shoulder position
-start_elbow = smooth_pos[2]     # Current elbow position
-start_gripper = smooth_pos[3]   # Current gripper position
+# Initial positions: the device code homes the arm and centres the gripper
+# first, as on a reused session the previous demo may have left it elsewhere
+start_shoulder = 90
+start_elbow = 90
+start_gripper = 90
 
 # Target positions for reaching forward
 reach_shoulder = 30
@@ -28,46 +26,44 @@ release_angle = 90 # More open
 # Lifting positions (slight lift)
 lift_shoulder = 35
 
+REACH = {
+    1: blend(start_shoulder, reach_shoulder, STEPS),
+    2: blend(start_elbow, reach_elbow, STEPS),
+}
+GRIP = {3: list(range(start_gripper, grip_angle, 1))}
+LIFT = {1: blend(reach_shoulder, lift_shoulder, 30)}
+RELEASE = {3: list(range(grip_angle, release_angle, -1))}
+
+CODE = SERVO_HEADER + '''
+print("\\n=== DEMO 08: Pick Up Object (Smooth) ===\\n")
+
+# The tracks below start from 90 on every joint
+home()
+move_servos_to({3: 90}, 0.5)
+
 print("Reaching forward...")
-for i in range(STEPS):
-    t = i / STEPS
-    s = minimum_jerk(t)
-    shoulder = start_shoulder + (reach_shoulder - start_shoulder) * s
-    elbow = start_elbow + (reach_elbow - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
-    time.sleep(DELAY)
+play_duties(%s)
 
 time.sleep(0.3)
 
 print("Gripping...")
-for angle in range(int(start_gripper), grip_angle, 1):
-    set_servo(3, angle)
-    time.sleep(0.02)
+play_duties(%s)
 
 time.sleep(0.5) # Important pause to ensure firm grip
 
 print("Lifting slightly...")
-lift_steps = 30
-for i in range(lift_steps):
-    t = i / lift_steps
-    s = minimum_jerk(t)
-    shoulder = reach_shoulder + (lift_shoulder - reach_shoulder) * s
-    set_servo(1, shoulder)
-    time.sleep(DELAY)
+play_duties(%s)
 
 time.sleep(0.3)
 
 print("Releasing...")
-for angle in range(grip_angle, release_angle, -1):
-    set_servo(3, angle)
-    time.sleep(0.02)
+play_duties(%s)
 
 time.sleep(0.3)
 
 home()
 print("\\n=== Pick up complete! ===")
-'''
+''' % tuple(duty_track(track, STEP_MS) for track in (REACH, GRIP, LIFT, RELEASE))
 
 if __name__ == "__main__":
     print("Demo 08: Pick Up Object (Smooth)")
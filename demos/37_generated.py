@@ -23,24 +23,27 @@ target_shoulder = 30
 target_elbow = 140
 
 print("Reaching forward...")
+d_base = target_base - start_base
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
 
-    base = start_base + (target_base - start_base) * s
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
+    base = start_base + d_base * s
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
 
-    set_servo(0, base)
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    set_servo_direct(0, base)
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 time.sleep(0.5)
 
 print("Gripping...")
 for angle in range(90, 181, 2):
-    set_servo(3, angle)
+    set_servo_direct(3, angle)
     time.sleep(0.01)
 
 time.sleep(0.5)
@@ -56,17 +59,20 @@ target_shoulder = 50
 target_elbow = 120
 
 print("Lifting...")
+d_base = target_base - start_base
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
 
-    base = start_base + (target_base - start_base) * s
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
+    base = start_base + d_base * s
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
 
-    set_servo(0, base)
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    set_servo_direct(0, base)
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 time.sleep(0.5)
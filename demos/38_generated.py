@@ -19,13 +19,15 @@ start_elbow = 100
 target_shoulder = 30
 target_elbow = 140
 
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 set_servo_direct(1, target_shoulder)
@@ -38,7 +40,7 @@ start_gripper = 90
 target_gripper = 180
 
 for angle in range(start_gripper, target_gripper + 1, 2):
-    set_servo(3, angle)
+    set_servo_direct(3, angle)
     time.sleep(0.01)
 
 set_servo_direct(3, target_gripper)
@@ -51,13 +53,15 @@ start_elbow = target_elbow
 target_shoulder = 50
 target_elbow = 120
 
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 set_servo_direct(1, target_shoulder)
@@ -19,15 +19,17 @@ start_elbow = 100
 target_shoulder = 30
 target_elbow = 140
 
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
 
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
 
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 # Ensure final position
@@ -39,7 +41,7 @@ time.sleep(0.5)
 # 2. Grip
 print("Gripping...")
 for angle in range(90, 181, 2):
-    set_servo(3, angle)
+    set_servo_direct(3, angle)
     time.sleep(DELAY)
 
 # Ensure final grip
@@ -54,15 +56,17 @@ start_elbow = 140
 target_shoulder = 50
 target_elbow = 120
 
+d_shoulder = target_shoulder - start_shoulder
+d_elbow = target_elbow - start_elbow
 for i in range(STEPS):
     t = i / STEPS
     s = minimum_jerk(t)
 
-    shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-    elbow = start_elbow + (target_elbow - start_elbow) * s
+    shoulder = start_shoulder + d_shoulder * s
+    elbow = start_elbow + d_elbow * s
 
-    set_servo(1, shoulder)
-    set_servo(2, elbow)
+    set_servo_direct(1, shoulder)
+    set_servo_direct(2, elbow)
     time.sleep(DELAY)
 
 # Ensure final lift
@@ -19,11 +19,13 @@ def reach_position():
     print("Reaching to position...")
     start_shoulder, start_elbow = smooth_pos[1], smooth_pos[2]
     target_shoulder, target_elbow = 30, 140
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(STEPS):
         t = i / STEPS
         s = minimum_jerk(t)
-        set_servo(1, start_shoulder + (target_shoulder - start_shoulder) * s)
-        set_servo(2, start_elbow + (target_elbow - start_elbow) * s)
+        set_servo_direct(1, start_shoulder + d_shoulder * s)
+        set_servo_direct(2, start_elbow + d_elbow * s)
         time.sleep(DELAY)
     set_servo_direct(1, target_shoulder)
     set_servo_direct(2, target_elbow)
@@ -35,10 +37,11 @@ def grip_object():
     start_gripper = smooth_pos[3]
     target_gripper = 180
     grip_steps = 50
+    d_gripper = target_gripper - start_gripper
     for i in range(grip_steps):
         t = i / grip_steps
         s = minimum_jerk(t)
-        set_servo(3, start_gripper + (target_gripper - start_gripper) * s)
+        set_servo_direct(3, start_gripper + d_gripper * s)
         time.sleep(DELAY)
     set_servo_direct(3, target_gripper)
     time.sleep(3) # CRITICAL: Wait for physical gripper to close
@@ -49,11 +52,13 @@ def lift_object():
     start_shoulder, start_elbow = smooth_pos[1], smooth_pos[2]
     target_shoulder, target_elbow = 50, 120
     lift_steps = 60
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(lift_steps):
         t = i / lift_steps
         s = minimum_jerk(t)
-        set_servo(1, start_shoulder + (target_shoulder - start_shoulder) * s)
-        set_servo(2, start_elbow + (target_elbow - start_elbow) * s)
+        set_servo_direct(1, start_shoulder + d_shoulder * s)
+        set_servo_direct(2, start_elbow + d_elbow * s)
         time.sleep(DELAY)
     set_servo_direct(1, target_shoulder)
     set_servo_direct(2, target_elbow)
@@ -19,14 +19,16 @@ def reach_and_grip():
     target_shoulder = 30
     target_elbow = 130
 
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(STEPS):
         t = i / STEPS
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
 
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(DELAY)
 
     set_servo_direct(1, target_shoulder)
@@ -35,7 +37,7 @@ def reach_and_grip():
 
     print("Gripping...")
     for angle in range(90, 181, 1):
-        set_servo(3, angle)
+        set_servo_direct(3, angle)
         time.sleep(DELAY)
 
     set_servo_direct(3, 180)
@@ -48,14 +50,16 @@ def lift_slightly():
     target_shoulder = 40
     target_elbow = 120
 
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(STEPS):
         t = i / STEPS
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
 
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(DELAY)
 
     set_servo_direct(1, target_shoulder)
@@ -66,7 +70,7 @@ def lift_slightly():
 def release():
     print("Releasing...")
     for angle in range(180, 90, -1):
-        set_servo(3, angle)
+        set_servo_direct(3, angle)
         time.sleep(DELAY)
 
     set_servo_direct(3, 90)
@@ -25,13 +25,15 @@ def reach_forward():
     start_elbow = smooth_pos[2]
     target_shoulder = 35
     target_elbow = 140
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(steps):
         t = i / steps
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(delay)
     set_servo_direct(1, target_shoulder)
     set_servo_direct(2, target_elbow)
@@ -44,9 +46,10 @@ def grip():
     target_angle = 180
     steps = 50
     delay = 0.02
+    d_angle = target_angle - start_angle
     for i in range(steps):
-        angle = start_angle + (target_angle - start_angle) * i / steps
-        set_servo(3, angle)
+        angle = start_angle + d_angle * i / steps
+        set_servo_direct(3, angle)
         time.sleep(delay)
     set_servo_direct(3, target_angle)
     time.sleep(1.5)
@@ -60,13 +63,15 @@ def lift():
     start_elbow = smooth_pos[2]
     target_shoulder = 55
     target_elbow = 120
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(steps):
         t = i / steps
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(delay)
     set_servo_direct(1, target_shoulder)
     set_servo_direct(2, target_elbow)
@@ -20,13 +20,15 @@ def reach_and_grip():
     target_shoulder = 20
     target_elbow = 150
 
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(steps):
         t = i / steps
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(delay)
     set_servo_direct(1, target_shoulder)
     set_servo_direct(2, target_elbow)
@@ -34,7 +36,7 @@ def reach_and_grip():
 
     print("Gripping...")
     for angle in range(90, 181, 2):
-        set_servo(3, angle)
+        set_servo_direct(3, angle)
         time.sleep(0.01)
     set_servo_direct(3, 180)
     time.sleep(0.5)
@@ -50,13 +52,15 @@ def lift_object():
     target_shoulder = 50
     target_elbow = 120
 
+    d_shoulder = target_shoulder - start_shoulder
+    d_elbow = target_elbow - start_elbow
     for i in range(steps):
         t = i / steps
         s = minimum_jerk(t)
-        shoulder = start_shoulder + (target_shoulder - start_shoulder) * s
-        elbow = start_elbow + (target_elbow - start_elbow) * s
-        set_servo(1, shoulder)
-        set_servo(2, elbow)
+        shoulder = start_shoulder + d_shoulder * s
+        elbow = start_elbow + d_elbow * s
+        set_servo_direct(1, shoulder)
+        set_servo_direct(2, elbow)
         time.sleep(delay)
 
     set_servo_direct(1, target_shoulder)
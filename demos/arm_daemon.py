@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Arm daemon - keeps one ESP32 connection open for the demos
+
+Every demo normally starts its own `mpremote`, which finds the port and
+renegotiates the REPL each run. While this is running, run_on_esp32()
+hands the demo's code over a Unix socket instead and it runs on the
+already-open session, so back-to-back demos start immediately.
+
+Usage:
+    python arm_daemon.py        (leave it running, then run demos as usual)
+"""
+
+import os
+import socket
+
+from utils import (ARM_SOCKET, SERVO_HEADER, Esp32Error, find_port, get_session,
+                   reset_session)
+
+
+def handle(conn):
+    """Run one demo's code and stream the device output back"""
+    chunks = []
+    while True:
+        data = conn.recv(65536)
+        if not data:
+            break
+        chunks.append(data)
+
+    code = b"".join(chunks)
+    header = SERVO_HEADER.encode("utf-8")
+
+    out = conn.makefile("wb")
+    ok = False
+    try:
+        session = get_session()
+        # Demos all start with SERVO_HEADER; it only needs to run once
+        if code.startswith(header):
+            session.exec_once(header)
+            code = code[len(header):]
+        session.exec(code, echo=out)
+        ok = True
+    except Esp32Error as e:
+        out.write(str(e).encode("utf-8"))
+    except OSError as e:
+        # Serial failure, or the demo was interrupted and hung up;
+        # reconnect (and stop the device) on the next request
+        print(f"Session dropped: {e}")
+        reset_session()
+
+    try:
+        out.write(b"\x04" + (b"0" if ok else b"1"))
+        out.flush()
+    except OSError:
+        pass
+
+
+def main():
+    port = find_port()
+    if port is None:
+        print("ERROR: No USB serial port found!")
+        return
+
+    get_session(port)
+    print(f"Connected to: {port}")
+
+    os.makedirs(os.path.dirname(ARM_SOCKET), exist_ok=True)
+    try:
+        os.remove(ARM_SOCKET)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(ARM_SOCKET)
+    # Only this user may send code to the arm
+    os.chmod(ARM_SOCKET, 0o600)
+    server.listen()
+    print(f"Listening on {ARM_SOCKET} - run demos as usual, Ctrl+C to stop")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                handle(conn)
+    except KeyboardInterrupt:
+        print("\nStopping")
+    finally:
+        server.close()
+        os.remove(ARM_SOCKET)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 """
 Run all demos in sequence
+
+All demos run over one serial session: the port is opened and
+SERVO_HEADER is sent once, then each demo only sends its own code.
+
+Usage:
+    python run_all.py          (demos 01-05)
+    python run_all.py --all    (plus every *_generated.py)
 """
 
-import subprocess
+import glob
+import importlib
+import os
 import sys
 import time
 
+from utils import SERVO_HEADER, run_in_session
+
 DEMOS = [
     ("01_test_servos.py", "Test Servos"),
     ("02_arm_circles.py", "Arm Circles"),
@@ -15,23 +26,57 @@ DEMOS = [
     ("05_wave_motion.py", "Wave Motion"),
 ]
 
+
+def generated_demos():
+    """(script, name) for every generated demo, in numeric order"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    scripts = sorted(glob.glob(os.path.join(script_dir, "*_generated.py")))
+    return [(os.path.basename(s), f"Generated {os.path.basename(s)[:2]}") for s in scripts]
+
+
+def load_code(script):
+    """A demo's device code, or None if the script doesn't load"""
+    name = script[:-3]
+    try:
+        return importlib.import_module(name).CODE
+    except (ImportError, SyntaxError, AttributeError) as e:
+        print(f"Skipping {script}: {e}")
+        return None
+    finally:
+        # Only CODE is needed; let the module (and its baked tables) be
+        # freed after its demo instead of keeping every demo loaded
+        sys.modules.pop(name, None)
+
+
+def run_code(code):
+    """Run demo code over the shared session; True on success"""
+    if code.startswith(SERVO_HEADER):
+        # Already on the device after the first demo
+        return run_in_session(code[len(SERVO_HEADER):], setup=SERVO_HEADER)
+    return run_in_session(code)
+
+
 def main():
+    demos = DEMOS + generated_demos() if "--all" in sys.argv[1:] else DEMOS
+
     print("=" * 40)
     print("   ROBOT ARM - ALL DEMOS")
     print("=" * 40)
     print()
 
-    for i, (script, name) in enumerate(DEMOS):
-        print(f"\n[{i+1}/{len(DEMOS)}] {name}")
+    for i, (script, name) in enumerate(demos):
+        print(f"\n[{i+1}/{len(demos)}] {name}")
         print("-" * 30)
 
-        result = subprocess.run([sys.executable, script])
+        code = load_code(script)
+        if code is None:
+            continue
 
-        if result.returncode != 0:
+        if not run_code(code):
             print(f"\nDemo {script} failed!")
             sys.exit(1)
 
-        if i < len(DEMOS) - 1:
+        if i < len(demos) - 1:
             print("\nNext demo in 2 seconds...")
             time.sleep(2)
 
@@ -2,12 +2,79 @@
 Shared utilities for robot arm demos
 """
 
+import atexit
+import functools
+import hashlib
+import importlib.util
+import math
+import os
+import socket
 import subprocess
 import sys
 import glob
+import tempfile
+import threading
+import time
+
+# Last working port, remembered across runs to skip re-scanning
+PORT_CACHE_FILE = os.path.expanduser("~/.cache/esp32_arm/port")
+
+_port = None
+
+# Unix socket of arm_daemon.py; demos hand their code to it when it runs
+ARM_SOCKET = os.path.expanduser("~/.cache/esp32_arm/daemon.sock")
+
+# SERVO_HEADER is kept on the device's flash as servo_hdr; this file
+# records which port/header version was last uploaded
+HEADER_MODULE = "servo_hdr"
+HEADER_CACHE_FILE = os.path.expanduser("~/.cache/esp32_arm/servo_hdr")
+
+# With the optional mpy-cross package installed, the header is uploaded as
+# precompiled servo_hdr.mpy, so the device skips parsing and compiling it.
+# mpy-cross must match the firmware's MicroPython version, so the upload is
+# checked with an import and replaced by the plain .py if that fails.
+MPY_ARCH = "rv32imc"
+
 
 def find_port():
-    """Auto-discover ESP32 serial port"""
+    """Auto-discover ESP32 serial port (cached in-process and on disk)"""
+    global _port
+    if _port is not None and os.path.exists(_port):
+        return _port
+
+    try:
+        with open(PORT_CACHE_FILE, 'r') as f:
+            cached = f.read().strip()
+    except OSError:
+        cached = ""
+
+    if cached and os.path.exists(cached):
+        _port = cached
+        return _port
+
+    _port = scan_ports()
+    if _port is not None:
+        try:
+            os.makedirs(os.path.dirname(PORT_CACHE_FILE), exist_ok=True)
+            with open(PORT_CACHE_FILE, 'w') as f:
+                f.write(_port)
+        except OSError:
+            pass
+    return _port
+
+
+def forget_port():
+    """Drop the remembered port (call when connecting to it fails)"""
+    global _port
+    _port = None
+    try:
+        os.remove(PORT_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def scan_ports():
+    """Scan for ESP32 serial ports, asking the user if several are found"""
     patterns = [
         '/dev/cu.usbserial-*',
         '/dev/cu.wchusbserial*',
@@ -35,9 +102,123 @@ def find_port():
     except:
         return ports[0]
 
+def run_via_daemon(micropython_code):
+    """
+    Run code through arm_daemon.py's open session, streaming its output.
+
+    Returns True/False for success, or None when no daemon is listening.
+    """
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(ARM_SOCKET)
+    except OSError:
+        return None
+
+    with sock:
+        sock.sendall(micropython_code.encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+
+        # Device output, then \x04 and a status byte ("0" = success)
+        status = None
+        while True:
+            data = sock.recv(4096)
+            if not data:
+                break
+            if status is not None:
+                status += data
+                continue
+            end = data.find(b"\x04")
+            if end >= 0:
+                status = data[end + 1:]
+                data = data[:end]
+            sys.stdout.buffer.write(data)
+            sys.stdout.flush()
+
+    return status == b"0"
+
+
+def compile_header(src):
+    """Compile a header .py file with mpy-cross; returns the .mpy path, or None"""
+    out = src[:-3] + ".mpy"
+    result = subprocess.run(
+        [sys.executable, "-m", "mpy_cross", f"-march={MPY_ARCH}", "-o", out, src],
+        capture_output=True
+    )
+    return out if result.returncode == 0 else None
+
+
+def ensure_header_uploaded(port):
+    """
+    Copy SERVO_HEADER to the device as servo_hdr.mpy (or .py without
+    mpy-cross) unless this exact version was already uploaded there.
+    Returns True if the device has it.
+    """
+    use_mpy = importlib.util.find_spec("mpy_cross") is not None
+    digest = hashlib.sha256(SERVO_HEADER.encode("utf-8")).hexdigest()[:16]
+    stamp = f"{port} {digest}"
+    try:
+        with open(HEADER_CACHE_FILE, 'r') as f:
+            if f.read() == stamp:
+                return True
+    except OSError:
+        pass
+
+    def mpremote(*args):
+        return subprocess.run(
+            [sys.executable, "-m", "mpremote", "connect", port, *args],
+            capture_output=True
+        ).returncode == 0
+
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+        f.write(SERVO_HEADER)
+    mpy = compile_header(f.name) if use_mpy else None
+    try:
+        ok = False
+        if mpy and mpremote("fs", "cp", mpy, f":{HEADER_MODULE}.mpy"):
+            # import prefers a .py over the .mpy, so drop any older upload
+            mpremote("fs", "rm", f":{HEADER_MODULE}.py")
+            # An .mpy from a mismatched mpy-cross only fails once imported
+            ok = mpremote("exec", f"import {HEADER_MODULE}")
+            if not ok:
+                print(f"{HEADER_MODULE}.mpy doesn't load on this firmware; "
+                      f"uploading {HEADER_MODULE}.py instead")
+                mpremote("fs", "rm", f":{HEADER_MODULE}.mpy")
+        if not ok:
+            ok = mpremote("fs", "cp", f.name, f":{HEADER_MODULE}.py")
+    finally:
+        os.remove(f.name)
+        if mpy:
+            os.remove(mpy)
+    if not ok:
+        return False
+
+    try:
+        os.makedirs(os.path.dirname(HEADER_CACHE_FILE), exist_ok=True)
+        with open(HEADER_CACHE_FILE, 'w') as f:
+            f.write(stamp)
+    except OSError:
+        pass
+    return True
+
+
+def forget_header():
+    """Re-upload servo_hdr next time (e.g. the board was reflashed)"""
+    try:
+        os.remove(HEADER_CACHE_FILE)
+    except OSError:
+        pass
+
+
 def run_on_esp32(micropython_code, port=None):
     """Send MicroPython code to ESP32 and run it"""
     if port is None:
+        # Already-open connection, if the arm daemon is running
+        ok = run_via_daemon(micropython_code)
+        if ok is True:
+            return
+        if ok is False:
+            print("\nError! Code failed on the ESP32 (via arm_daemon.py)")
+            sys.exit(1)
         port = find_port()
 
     if port is None:
@@ -49,18 +230,413 @@ def run_on_esp32(micropython_code, port=None):
 
     print(f"Connected to: {port}\n")
 
+    # The header is imported from flash instead of being sent and parsed
+    # as part of every demo
+    if micropython_code.startswith(SERVO_HEADER) and ensure_header_uploaded(port):
+        micropython_code = (f"from {HEADER_MODULE} import *\n"
+                            + micropython_code[len(SERVO_HEADER):])
+
     result = subprocess.run(
         [sys.executable, "-m", "mpremote", "connect", port, "exec", micropython_code],
         capture_output=False
     )
 
     if result.returncode != 0:
+        # Port may be stale (board replugged under another name) - rescan next time
+        forget_port()
+        forget_header()
         print("\nError! Try:")
         print("  1. Close any program using the port")
         print("  2. Press RESET on ESP32")
         print("  3. Run: bash setup.sh")
         sys.exit(1)
 
+class Esp32Error(Exception):
+    """Raised when code sent to the ESP32 fails on the device"""
+
+
+class Esp32Session:
+    """
+    Persistent raw-REPL connection to the ESP32.
+
+    `mpremote connect ... exec` re-opens the serial port and renegotiates the
+    REPL on every call (hundreds of ms). A session opens the port once and
+    keeps it; globals defined by one exec() stay available to the next, so
+    setup code only has to be sent once.
+    """
+
+    def __init__(self, port, baudrate=115200):
+        import serial  # pyserial - installed with mpremote
+
+        self.port = port
+        self.serial = serial.Serial(port, baudrate, timeout=0.1)
+        self.lock = threading.Lock()
+        self._rx = b""
+        self._loaded = set()
+        # Duty last written to each servo by send_servo_angles()
+        self.duties = {}
+        self._enter_raw_repl()
+
+    def _read_until(self, ending, timeout=5.0, echo=False):
+        """Read up to `ending` and return the bytes before it"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        echoed = 0
+        while True:
+            end = self._rx.find(ending)
+            if echo:
+                stop = end if end >= 0 else len(self._rx)
+                if stop > echoed:
+                    out = sys.stdout.buffer if echo is True else echo
+                    out.write(self._rx[echoed:stop])
+                    out.flush()
+                    echoed = stop
+            if end >= 0:
+                data, self._rx = self._rx[:end], self._rx[end + len(ending):]
+                return data
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"No response from ESP32 on {self.port}")
+            self._rx += self.serial.read(self.serial.in_waiting or 1)
+
+    def _enter_raw_repl(self):
+        # Interrupt anything still running, then switch to raw REPL
+        self.serial.write(b"\r\x03\x03")
+        time.sleep(0.1)
+        self.serial.reset_input_buffer()
+        self._rx = b""
+        self.serial.write(b"\r\x01")
+        self._read_until(b"raw REPL; CTRL-B to exit\r\n>")
+
+    def exec(self, code, timeout=None, echo=True):
+        """
+        Run code on the ESP32 and return what it printed.
+
+        Output is streamed to stdout as it arrives when echo is True, or
+        to echo itself when it is a binary stream.
+        Raises Esp32Error with the device traceback if the code fails.
+        """
+        if isinstance(code, str):
+            code = code.encode("utf-8")
+
+        with self.lock:
+            # Small chunks so the device's input buffer never overflows
+            for i in range(0, len(code), 256):
+                self.serial.write(code[i:i + 256])
+                time.sleep(0.01)
+            self.serial.write(b"\x04")
+
+            self._read_until(b"OK")
+            output = self._read_until(b"\x04", timeout, echo)
+            error = self._read_until(b"\x04", timeout)
+            self._read_until(b">")
+
+        if error:
+            raise Esp32Error(error.decode("utf-8", "replace"))
+        return output.decode("utf-8", "replace")
+
+    def exec_once(self, code):
+        """Run setup code only if this session hasn't run it yet"""
+        if code not in self._loaded:
+            self.exec(code, echo=False)
+            self._loaded.add(code)
+
+    def close(self):
+        """Leave raw REPL and release the serial port"""
+        try:
+            self.serial.write(b"\r\x02")
+        finally:
+            self.serial.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(port=None):
+    """Return the shared ESP32 session, connecting on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            if port is None:
+                port = find_port()
+            if port is None:
+                raise Esp32Error("No USB serial port found")
+            try:
+                _session = Esp32Session(port)
+            except OSError:
+                forget_port()
+                raise
+            atexit.register(_session.close)
+        return _session
+
+
+def reset_session():
+    """Drop the shared session (e.g. after the board was unplugged)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            try:
+                _session.close()
+            except Exception:
+                pass
+            _session = None
+
+
+def run_in_session(code, port=None, setup=None):
+    """
+    Run code over the shared session, streaming its output.
+
+    code may be a string or an iterable of strings; chunks are sent one
+    at a time, so long sequences never have to fit in device RAM at once
+    and Ctrl-C stops between (or during) chunks. setup (e.g. a helper
+    runtime) is only sent the first time this session sees it.
+
+    Returns True on success. Device tracebacks are printed; on a serial
+    failure the session and remembered port are dropped so the next
+    attempt reconnects from scratch.
+    """
+    if isinstance(code, str):
+        code = [code]
+    session = None
+    try:
+        session = get_session(port)
+        # Arbitrary code may move servos; don't trust remembered duties
+        session.duties.clear()
+        if setup is not None:
+            session.exec_once(setup)
+        for chunk in code:
+            session.exec(chunk)
+        return True
+    except Esp32Error as e:
+        print(e, end="")
+    except OSError as e:
+        print(f"Serial error: {e}")
+        reset_session()
+        forget_port()
+    except KeyboardInterrupt:
+        print("\nInterrupted - stopping ESP32")
+        # Ctrl-C on the device too, then reconnect cleanly next time
+        if session is not None:
+            try:
+                session.serial.write(b"\x03\x03")
+            except Exception:
+                pass
+        reset_session()
+    return False
+
+
+# Angle (0-180) -> PWM duty cycle, precomputed on the host.
+# Same table and lookup as the device-side angle_to_duty in SERVO_HEADER:
+# round(26 + a * (128 - 26) / 180) in integers (4770 = 26 * 180 + 90),
+# with fractional angles rounded half up by int(angle + 0.5).
+DUTY_TABLE = tuple((a * 102 + 4770) // 180 for a in range(181))
+
+
+def angle_to_duty(angle):
+    """Clamp an angle to 0-180 and look up its duty cycle"""
+    return DUTY_TABLE[max(0, min(180, int(angle + 0.5)))]
+
+
+def minimum_jerk(t):
+    """Smooth 0-1 motion profile, same as the device-side version"""
+    return t * t * t * (10 + t * (-15 + 6 * t))
+
+
+# minimum_jerk at 512 steps scaled 0-255; SERVO_HEADER embeds it as _MJ
+MJ_TABLE = bytes(int(minimum_jerk(i / 512) * 255 + 0.5) for i in range(513))
+
+
+@functools.lru_cache(maxsize=None)
+def jerk_table(points):
+    """minimum_jerk(i / points) per step, shared by every move of that length"""
+    return tuple(minimum_jerk(i / points) for i in range(points))
+
+
+@functools.lru_cache(maxsize=None)
+def sine_table(points):
+    """sin(2*pi * i / points) per step - one full cycle, shared like jerk_table"""
+    return tuple(math.sin(2 * math.pi * i / points) for i in range(points))
+
+
+def blend(start, end, points, profile=minimum_jerk):
+    """Angles easing from start towards end, one per step (t = i / points)"""
+    if profile is minimum_jerk:
+        steps = jerk_table(points)
+    else:
+        steps = [profile(i / points) for i in range(points)]
+    delta = end - start
+    return [start + delta * s for s in steps]
+
+
+# Servo PWM runs at 50 Hz: a new duty only takes effect at the next 20 ms
+# frame, so stepping any faster just overwrites values the servo never sees
+PWM_FRAME_MS = 20
+
+
+def goto(servo_num, start, end, ms):
+    """Linear move from start to end over ms, one angle per PWM frame, ending on end"""
+    steps = max(1, ms // PWM_FRAME_MS)
+    return {servo_num: [start + (end - start) * (i + 1) / steps for i in range(steps)]}
+
+
+def sweep(center, span, step=1):
+    """Angles out to center + span, across to center - span, then back to center"""
+    return (list(range(center, center + span, step))
+            + list(range(center + span, center - span, -step))
+            + list(range(center - span, center, step)))
+
+
+def together(*moves):
+    """
+    Merge {servo_num: angles} moves into one track that plays them at the
+    same time. Shorter moves hold their last angle until the longest ends.
+    """
+    merged = {}
+    for move in moves:
+        merged.update(move)
+    length = max(len(angles) for angles in merged.values())
+    return {s: list(angles) + [angles[-1]] * (length - len(angles))
+            for s, angles in merged.items()}
+
+
+def duty_track(tracks, step_ms):
+    """
+    Precompute a move for play_duties() in SERVO_HEADER.
+
+    tracks maps servo_num -> list of angles, one per step. Duties are looked
+    up here and packed into bytes, so the ESP32 does no trig or profile math
+    and only writes them out every step_ms. Returns the literal to embed in
+    the demo's device code.
+    """
+    servo_nums = tuple(sorted(tracks))
+    frames = zip(*(tracks[s] for s in servo_nums))
+    tbl = bytes(angle_to_duty(a) for frame in frames for a in frame)
+    final = tuple(round(float(tracks[s][-1]), 1) for s in servo_nums)
+    return repr((tbl, servo_nums, step_ms, final))
+
+
+# Device-side helper for tools that drive servos one at a time.
+# The host sends ready-made duty values, so the device does no float math.
+# Each pin's PWM is created on first use so untouched servos stay idle.
+SERVO_SESSION_SETUP = '''
+from machine import Pin, PWM
+
+_pwms = {}
+
+def servo_duty(servo_num, duty):
+    pwm = _pwms.get(servo_num)
+    if pwm is None:
+        pwm = PWM(Pin(servo_num + 4), freq=50)
+        _pwms[servo_num] = pwm
+    pwm.duty(duty)
+
+def servo_duties(frames):
+    # frames: bytes of (servo_num, duty) pairs
+    for i in range(0, len(frames), 2):
+        servo_duty(frames[i], frames[i + 1])
+'''
+
+
+def send_servo_angles(moves, port=None):
+    """
+    Move servos ({servo_num: angle}) with one call over the shared session.
+
+    SERVO_SESSION_SETUP is loaded once per session; after that each batch
+    is a single servo_duties(b'...') call carrying (servo, duty) byte
+    pairs. Servos already at the requested duty are left out (nearby
+    angles share a duty), and a batch with nothing left isn't sent at all.
+    Returns True on success; on failure the session is dropped so the next
+    call reconnects.
+    """
+    try:
+        session = get_session(port)
+        changed = []
+        for servo_num, angle in sorted(moves.items()):
+            duty = angle_to_duty(angle)
+            if session.duties.get(servo_num) != duty:
+                changed.append((servo_num, duty))
+        if not changed:
+            return True
+        frames = bytes(b for pair in changed for b in pair)
+        session.exec_once(SERVO_SESSION_SETUP)
+        session.exec(f"servo_duties({frames!r})", timeout=5, echo=False)
+        session.duties.update(changed)
+        return True
+    except Exception as e:
+        print(f"Error moving servo: {e}")
+        # Board may have been reset/unplugged - reconnect next time
+        reset_session()
+        return False
+
+
+def connect_in_background(port=None):
+    """
+    Open the shared session and load SERVO_SESSION_SETUP on a worker thread.
+
+    Tools call this at startup so the port lookup, raw-REPL handshake and
+    setup upload are done before the first slider move. Failures are only
+    reported; send_servo_angles() retries the connection on demand.
+    """
+    def connect():
+        try:
+            get_session(port).exec_once(SERVO_SESSION_SETUP)
+        except Exception as e:
+            print(f"ESP32 not connected yet: {e}")
+            reset_session()
+
+    threading.Thread(target=connect, daemon=True).start()
+
+
+# Slider drags fire many /move requests; they are collected for this long
+# and sent to the ESP32 as one command with the latest angle per servo
+MOVE_FLUSH_INTERVAL = 0.020
+
+
+class MoveCoalescer:
+    """
+    Collect servo moves for a short window, then send them as one batch.
+
+    Slider drags fire many /move requests; only the latest angle per servo
+    within the window is sent (send({servo_num: angle})), so the arm tracks
+    the slider instead of replaying every intermediate value. Requests
+    return without waiting on serial.
+    """
+
+    def __init__(self, send, interval):
+        self.send = send
+        self.interval = interval
+        self.pending = {}
+        self.lock = threading.Lock()
+        # One flush at a time so a newer batch can't overtake an older one
+        self.flush_lock = threading.Lock()
+        self.timer = None
+
+    def queue(self, servo_num, angle):
+        """Queue a move; superseded angles within the window are dropped"""
+        with self.lock:
+            self.pending[servo_num] = angle
+            if self.timer is None:
+                self.timer = threading.Timer(self.interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Send the latest queued angle for each servo in a single batch"""
+        with self.flush_lock:
+            with self.lock:
+                batch = dict(self.pending)
+                self.pending.clear()
+                self.timer = None
+
+            if batch:
+                self.send(batch)
+
+
 # Shared MicroPython code header for servo control
 SERVO_HEADER = '''
 from machine import Pin, PWM
@@ -81,16 +657,24 @@ def watchdog_callback(t):
         if time.ticks_diff(now, last_move[i]) > 10000:
             servos[i].duty(0)
 
-# Start background watchdog (checks every second)
+# Start background watchdog (checks every second); on a reused session
+# (arm_daemon.py) stop the previous run's timer first
 from machine import Timer
+try:
+    watchdog_timer.deinit()
+except NameError:
+    pass
 watchdog_timer = Timer(-1)
 watchdog_timer.init(period=1000, mode=Timer.PERIODIC, callback=watchdog_callback)
 
 # --- Low-Level Control ---
 
+# Angle (0-180) -> PWM duty cycle, built once at load
+_DUTY = tuple((a * 102 + 4770) // 180 for a in range(181))
+
 def angle_to_duty(angle):
     """Converts angle (0-180) to PWM duty cycle."""
-    return int(round(26 + (angle / 180.0) * (128 - 26)))
+    return _DUTY[max(0, min(180, int(angle + 0.5)))]
 
 def set_servo_direct(servo_num, angle):
     """Sets a servo to a specific angle immediately."""
@@ -99,6 +683,83 @@ def set_servo_direct(servo_num, angle):
     smooth_pos[servo_num] = float(angle)
     last_move[servo_num] = time.ticks_ms()
 
+def set_servo_raw(servo_num, duty):
+    """Writes an already-computed duty cycle; smooth_pos is left to the caller."""
+    servos[servo_num].duty(duty)
+    last_move[servo_num] = time.ticks_ms()
+
+# Trajectory playback: a hardware timer writes one frame per tick, so step
+# timing doesn't depend on sleep() wakeups or interpreter speed
+play_timer = Timer(0)
+_playing = None
+
+def _play_tick(t):
+    # [duties, pwms, servos per frame, next offset]
+    state = _playing
+    tbl, pwms, n, pos = state
+    if pos < len(tbl):
+        for k in range(n):
+            pwms[k].duty(tbl[pos + k])
+        state[3] = pos + n
+
+# Track started by start_duties() that wait_duties() hasn't finished yet
+_play_track = None
+
+def start_duties(track):
+    """Starts replaying a track from the timer and returns at once."""
+    global _playing, _play_track
+    # One track at a time
+    wait_duties()
+    tbl, servo_nums, step_ms, final = track
+    _playing = [tbl, [servos[s] for s in servo_nums], len(servo_nums), 0]
+    _play_track = track
+    _play_tick(play_timer)
+    play_timer.init(period=step_ms, mode=Timer.PERIODIC, callback=_play_tick)
+
+def wait_duties():
+    """Blocks until the track from start_duties() has played out."""
+    global _play_track
+    track = _play_track
+    if track is None:
+        return
+    tbl, servo_nums, step_ms, final = track
+    state = _playing
+    try:
+        while state[3] < len(tbl):
+            time.sleep_ms(step_ms)
+        # Hold the last frame for its full step, like every other frame
+        time.sleep_ms(step_ms)
+    finally:
+        play_timer.deinit()
+        _play_track = None
+    now = time.ticks_ms()
+    for k in range(len(servo_nums)):
+        smooth_pos[servo_nums[k]] = final[k]
+        last_move[servo_nums[k]] = now
+
+def play_duties(track):
+    """Replays a host-computed (duties, servo_nums, step_ms, final) track."""
+    start_duties(track)
+    wait_duties()
+
+def wait_step(deadline, period_us):
+    """Sleeps until one period past `deadline` (ticks_us) and returns that time."""
+    # Paced from the previous deadline, so time spent in the loop body
+    # doesn't add up into drift the way a fixed sleep() per step does
+    deadline = time.ticks_add(deadline, period_us)
+    wait = time.ticks_diff(deadline, time.ticks_us())
+    if wait > 0:
+        time.sleep_us(wait)
+    return deadline
+
+def ramp(servo_num, start, end, step, delay=0.02):
+    """Steps a servo from start to end (inclusive) in `step`-degree increments."""
+    period_us = int(delay * 1000000)
+    deadline = time.ticks_us()
+    for angle in range(start, end + (1 if step > 0 else -1), step):
+        set_servo_direct(servo_num, angle)
+        deadline = wait_step(deadline, period_us)
+
 def stop_servo(servo_num):
     """Stops the PWM signal to a servo, allowing it to relax/detach."""
     servos[servo_num].duty(0)
@@ -107,9 +768,15 @@ def stop_servo(servo_num):
 
 def minimum_jerk(t):
     """Calculates a smooth, human-like motion profile."""
-    t2 = t * t
-    t3 = t2 * t
-    return 10 * t3 - 15 * t3 * t + 6 * t3 * t2
+    return t * t * t * (10 + t * (-15 + 6 * t))
+
+# minimum_jerk at 512 steps scaled 0-255 (built on the host), so easing a
+# step is one byte fetch
+_MJ = ''' + repr(MJ_TABLE) + '''
+
+def mj_u8(i, n):
+    """minimum_jerk(i / n) scaled 0-255, from the lookup table."""
+    return _MJ[(i * 512) // n]
 
 # --- NEW: State Machine Core Function ---
 
@@ -121,23 +788,24 @@ def move_servos_to(targets, duration):
     """
     global smooth_pos
     
-    start_pos = {}
-    for s_num in targets.keys():
-        start_pos[s_num] = smooth_pos[s_num]
+    # Interpolated in duty counts, so each step is integer math and a
+    # raw PWM write with no angle conversion
+    moves = []
+    for s_num, target_angle in targets.items():
+        start_duty = angle_to_duty(smooth_pos[s_num])
+        moves.append((s_num, start_duty, angle_to_duty(target_angle) - start_duty))
     
     steps = int(duration / 0.02) # Aim for a 50Hz update rate (20ms)
     if steps < 1:
         steps = 1
         
+    deadline = time.ticks_us()
     for i in range(steps):
-        t = (i + 1) / steps
-        s = minimum_jerk(t)
-        for s_num, target_angle in targets.items():
-            start_angle = start_pos[s_num]
-            current_angle = start_angle + (target_angle - start_angle) * s
-            # Use a simplified, direct smoothing approach for this model
-            set_servo_direct(s_num, current_angle) 
-        time.sleep(0.02)
+        # Integer-only easing, so the loop allocates no floats
+        s = mj_u8(i + 1, steps)
+        for s_num, start_duty, delta in moves:
+            set_servo_raw(s_num, start_duty + (delta * s) // 255)
+        deadline = wait_step(deadline, 20000)
         
     # After the loop, guarantee the final position
     for s_num, target_angle in targets.items():
@@ -220,7 +220,7 @@ def angle_to_duty(angle):
 
 def minimum_jerk(t):
     """Minimum jerk trajectory for smooth motion"""
-    return 10 * (t ** 3) - 15 * (t ** 4) + 6 * (t ** 5)
+    return t * t * t * (10 + t * (-15 + 6 * t))
 
 def set_servo(servo_num, angle):
     """Set servo with exponential smoothing"""